@@ -6,7 +6,6 @@ Simple web scraping from your terminal
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .commands.scrape import scrape
 from .commands.crawl import crawl
@@ -21,7 +20,7 @@ from .commands.yt_search import yt_search
 from .commands.transcribe import transcribe
 from .commands.x import x
 from .commands.reddit import reddit
-from .utils.config import load_config, get_firecrawl_client
+from .utils.config import load_config
 
 console = Console()
 
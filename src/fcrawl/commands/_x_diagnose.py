@@ -7,7 +7,6 @@ from typing import Any, Callable
 
 import httpx
 from rich.console import Console
-from rich.table import Table
 
 from ..utils.x_client import get_x_api, get_x_pool
 from ..vendors.twscrape import NoAccountError
@@ -178,6 +177,8 @@ def render_diagnostics(report: dict[str, Any], console: Console) -> None:
     if not accounts:
         console.print("[yellow]No accounts configured.[/yellow]")
     else:
+        from rich.table import Table
+
         table = Table()
         table.add_column("Username", style="cyan")
         table.add_column("Active")
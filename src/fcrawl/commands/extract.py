@@ -77,6 +77,8 @@ def extract(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
+        transient=True,
     ) as progress:
         task = progress.add_task(f"Extracting from {len(urls)} URL(s)...", total=None)
 
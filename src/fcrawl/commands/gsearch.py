@@ -319,6 +319,8 @@ def gsearch(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             task = progress.add_task(f"Searching Google for '{query}'...", total=None)
 
@@ -54,6 +54,8 @@ def map_site(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
+        transient=True,
     ) as progress:
         task = progress.add_task(f"Mapping {url}...", total=None)
 
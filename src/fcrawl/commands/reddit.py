@@ -4,25 +4,106 @@ Read-only access to Reddit via public .json endpoints.
 No authentication or API keys required.
 """
 
-import json
+import functools
+import operator
 import re
 import shlex
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import click
 from rich.console import Console
 from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
 from ..utils.cache import cache_key, read_cache, write_cache
-from ..utils.output import save_to_file, resolve_pretty
+from ..utils.output import dump_json, emit_json, save_to_file, resolve_pretty
 from ..utils.reddit_client import RedditClient
 
 console = Console()
 
 POST_ID_RE = re.compile(r"^[a-z0-9]{5,10}$", re.IGNORECASE)
+_HAS_SCHEME = ("http://", "https://")
+# Names never contain whitespace, so drop it wherever it appears
+_TRIM = str.maketrans("", "", " \t\n\r")
+_SHARE_TARGET_RE = re.compile(
+    r"(?:(?:https?://)?(?:www\.|old\.)?reddit\.com)?/r/[^/]+/s/[^/]+",
+    re.IGNORECASE,
+)
+_COMMENTS_PATH_RE = re.compile(r"/comments/([a-z0-9]+)", re.IGNORECASE)
+_FULL_URL_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:https?://)?(?:www\.|old\.)?reddit\.com/(?:r/[^/]+/)?comments/([a-z0-9]+)",
+        r"(?:https?://)?redd\.it/([a-z0-9]+)",
+    )
+)
+
+_POST_FIELDS = ("subreddit", "title", "score", "created_utc", "permalink")
+_POST_GET = operator.itemgetter(*_POST_FIELDS)
+_POST_DEFAULTS = {
+    "subreddit": "",
+    "title": "",
+    "score": 0,
+    "created_utc": None,
+    "permalink": "",
+}
+
+_COMMENT_FIELDS = (
+    "subreddit",
+    "body",
+    "score",
+    "created_utc",
+    "link_title",
+    "permalink",
+)
+_COMMENT_GET = operator.itemgetter(*_COMMENT_FIELDS)
+_COMMENT_DEFAULTS = {
+    "subreddit": "",
+    "body": "",
+    "score": 0,
+    "created_utc": None,
+    "link_title": "",
+    "permalink": "",
+}
+
+_POST_COLS = operator.itemgetter(
+    "subreddit",
+    "author",
+    "score",
+    "num_comments",
+    "created_utc",
+    "title",
+    "link_flair_text",
+    "permalink",
+)
+_POST_COLS_DEFAULTS = {
+    "subreddit": "",
+    "author": "[deleted]",
+    "score": 0,
+    "num_comments": 0,
+    "created_utc": None,
+    "title": "",
+    "link_flair_text": None,
+    "permalink": "",
+}
+
+# Comment-tree prefixes indexed by depth; grown on demand by _ensure_prefixes
+_INDENTS = ["  " * d for d in range(8)]
+_BARS = ["[dim]|[/dim] " * d for d in range(8)]
+
+_ROW_SUB = "r/%s"
+_ROW_AUTHOR = "u/%s"
+_ROW_TITLE = "[%s] %s"
+
+_DIVIDER = "-" * 40
 
 
 # ---------------------------------------------------------------------------
@@ -30,6 +111,7 @@ POST_ID_RE = re.compile(r"^[a-z0-9]{5,10}$", re.IGNORECASE)
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
 def format_number(n: int | None) -> str:
     """Format a number for display (1.2K, 3.4M, etc.)."""
     if n is None:
@@ -43,14 +125,18 @@ def format_number(n: int | None) -> str:
 
 def format_timestamp(utc: float | int | None) -> str:
     """Convert Unix timestamp to human-readable relative time."""
+    return _format_age(utc, time.time())
+
+
+def _format_age(utc: float | int | None, now_ts: float) -> str:
+    """Relative age of utc against a clock reading captured by the caller."""
     if utc is None:
         return "unknown"
+    return _format_age_from_delta(int(now_ts - utc))
 
-    now = datetime.now(timezone.utc)
-    dt = datetime.fromtimestamp(utc, tz=timezone.utc)
-    delta = now - dt
 
-    seconds = int(delta.total_seconds())
+def _format_age_from_delta(seconds: int) -> str:
+    """Format an age in whole seconds as 5m/3h/2d/4mo/1y ago."""
     if seconds < 60:
         return "just now"
     minutes = seconds // 60
@@ -81,6 +167,8 @@ def _truncate(text: str | None, length: int = 80) -> str:
     """Truncate text to length."""
     if not text:
         return ""
+    if len(text) <= length and "\n" not in text:
+        return text.strip()
     value = text.replace("\n", " ").strip()
     if len(value) <= length:
         return value
@@ -91,17 +179,47 @@ def _absolute_reddit_url(path_or_url: str | None) -> str:
     """Convert Reddit path to absolute URL if needed."""
     if not path_or_url:
         return ""
-    if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
+    return _absolute_reddit_url_cached(path_or_url)
+
+
+@functools.lru_cache(maxsize=8192)
+def _absolute_reddit_url_cached(path_or_url: str) -> str:
+    """Memoized body of _absolute_reddit_url for non-empty input."""
+    if path_or_url.startswith(_HAS_SCHEME):
         return path_or_url
     if not path_or_url.startswith("/"):
         path_or_url = "/" + path_or_url
     return f"https://www.reddit.com{path_or_url}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _safe_sub(name: str) -> str:
+    """Markup-escape a subreddit name; listings repeat the same few names."""
+    return escape(name)
+
+
+def _ensure_prefixes(depth: int):
+    """Make sure _INDENTS and _BARS have entries up to depth."""
+    for d in range(len(_INDENTS), depth + 1):
+        _INDENTS.append("  " * d)
+        _BARS.append("[dim]|[/dim] " * d)
+
+
+def _row(data: dict, getter: operator.itemgetter, defaults: dict) -> tuple:
+    """Pull several fields from a listing item in one call.
+
+    Falls back to the defaults for any key Reddit left out.
+    """
+    try:
+        return getter(data)
+    except KeyError:
+        return getter({**defaults, **data})
+
+
 def _normalize_subreddit(name: str) -> str:
     """Normalize subreddit input to bare name."""
-    value = name.strip().strip("/")
-    if value.lower().startswith("r/"):
+    value = name.translate(_TRIM).strip("/")
+    if value[:2].lower() == "r/":
         value = value[2:]
     if not value:
         raise click.BadParameter("subreddit cannot be empty")
@@ -110,37 +228,57 @@ def _normalize_subreddit(name: str) -> str:
 
 def _normalize_username(username: str) -> str:
     """Normalize username input to bare username."""
-    value = username.strip().strip("/")
-    if value.lower().startswith("u/"):
+    value = username.translate(_TRIM).strip("/")
+    if value[:2].lower() == "u/":
         value = value[2:]
     if not value:
         raise click.BadParameter("username cannot be empty")
     return value
 
 
+def _strip_query(url: str) -> str:
+    """Drop query string, fragment and trailing slash from a URL or path."""
+    url = url.strip()
+    # Most pasted URLs have neither delimiter; skip the splits entirely then.
+    if "?" in url or "#" in url:
+        url = url.split("?", 1)[0].split("#", 1)[0].strip()
+    return url.rstrip("/")
+
+
 def _is_share_target(target: str) -> bool:
     """Return True when target matches Reddit /s/ share URL pattern."""
-    return bool(
-        re.fullmatch(
-            r"(?:(?:https?://)?(?:www\.|old\.)?reddit\.com)?/r/[^/]+/s/[^/]+",
-            target,
-            re.IGNORECASE,
-        )
-    )
+    return _SHARE_TARGET_RE.fullmatch(target) is not None
 
 
-def _resolve_share_target(target: str, client: RedditClient) -> str:
-    """Resolve Reddit /s/ share URL via HTTP redirect."""
+def _resolve_share_target(
+    target: str, client: RedditClient, use_cache: bool = True
+) -> str:
+    """Resolve Reddit /s/ share URL via HTTP redirect.
+
+    Share tokens always point at the same post, so resolutions are cached
+    on disk and repeat lookups skip the redirect round-trip.
+    """
     if target.startswith("/"):
         target = f"https://www.reddit.com{target}"
-    elif not target.startswith("http://") and not target.startswith("https://"):
+    elif not target.startswith(_HAS_SCHEME):
         target = f"https://{target}"
 
-    resolved = client.resolve_share_url(target)
-    return resolved.split("?")[0].split("#")[0].strip().rstrip("/")
+    key = cache_key(target)
+    if use_cache:
+        cached = read_cache("reddit-share", key)
+        if cached and cached.get("url"):
+            return cached["url"]
+
+    resolved = _strip_query(client.resolve_share_url(target))
+    write_cache("reddit-share", key, {"url": resolved})
+    return resolved
 
 
-def _parse_post_target(url_or_id: str, client: Optional[RedditClient] = None) -> str:
+def _parse_post_target(
+    url_or_id: str,
+    client: Optional[RedditClient] = None,
+    use_cache: bool = True,
+) -> str:
     """Extract post path from URL/short URL/path/post ID.
 
     Accepted inputs:
@@ -155,11 +293,11 @@ def _parse_post_target(url_or_id: str, client: Optional[RedditClient] = None) ->
     Returns:
         comments/<id>
     """
-    target = url_or_id.strip().split("?")[0].split("#")[0].strip().rstrip("/")
+    target = _strip_query(url_or_id)
 
     if client and _is_share_target(target):
         try:
-            target = _resolve_share_target(target, client)
+            target = _resolve_share_target(target, client, use_cache=use_cache)
         except Exception as exc:
             raise ValueError(
                 f"Cannot resolve Reddit share URL: {url_or_id} ({exc})"
@@ -169,34 +307,53 @@ def _parse_post_target(url_or_id: str, client: Optional[RedditClient] = None) ->
         return f"comments/{target.lower()}"
 
     if target.startswith("/"):
-        match = re.search(r"/comments/([a-z0-9]+)", target, re.IGNORECASE)
+        match = _COMMENTS_PATH_RE.search(target)
         if match:
             return f"comments/{match.group(1).lower()}"
 
-    full_url_patterns = [
-        r"(?:https?://)?(?:www\.|old\.)?reddit\.com/(?:r/[^/]+/)?comments/([a-z0-9]+)",
-        r"(?:https?://)?redd\.it/([a-z0-9]+)",
-    ]
-    for pattern in full_url_patterns:
-        match = re.search(pattern, target, re.IGNORECASE)
+    for pattern in _FULL_URL_RES:
+        match = pattern.search(target)
         if match:
             return f"comments/{match.group(1).lower()}"
 
     raise ValueError(f"Cannot parse Reddit URL/ID: {url_or_id}")
 
 
+def _iter_post_json(
+    post: dict, comments: Iterable[Any], meta: Any, pretty: bool
+) -> Iterator[bytes]:
+    """Yield the reddit post JSON envelope chunk by chunk.
+
+    Produces the same bytes as dump_json({"post", "comments", "meta"}) but
+    encodes each top-level comment separately.
+    """
+    if not pretty:
+        yield b'{"post":' + dump_json(post, False) + b',"comments":['
+        for idx, comment in enumerate(comments):
+            yield (b"," if idx else b"") + dump_json(comment, False)
+        yield b'],"meta":' + dump_json(meta, False) + b"}"
+        return
+
+    def nested(value: Any, indent: bytes) -> bytes:
+        return dump_json(value).replace(b"\n", b"\n" + indent)
+
+    yield b'{\n  "post": ' + nested(post, b"  ") + b',\n  "comments": ['
+    empty = True
+    for comment in comments:
+        yield (b"\n    " if empty else b",\n    ") + nested(comment, b"    ")
+        empty = False
+    yield (b"]" if empty else b"\n  ]") + b',\n  "meta": ' + nested(meta, b"  ")
+    yield b"\n}"
+
+
 def _print_json_or_save(
     data: Any, output: Optional[str], json_output: bool, pretty: bool
 ):
     """Emit JSON output to file and/or terminal."""
-    text = json.dumps(data, indent=2 if pretty else None)
     if output:
-        save_to_file(text, output, "json")
+        save_to_file(dump_json(data, pretty), output, "json")
     if json_output and not output:
-        if pretty:
-            console.print_json(text)
-        else:
-            print(text)
+        emit_json(data, pretty)
 
 
 def _fetch_with_cache(
@@ -208,32 +365,107 @@ def _fetch_with_cache(
     cache_only: bool,
     progress_label: str,
 ) -> tuple[Any, bool]:
-    """Fetch Reddit JSON with on-disk cache support."""
-    key = cache_key(path, params)
+    """Fetch Reddit JSON with on-disk cache support.
 
-    if not no_cache:
-        cached = read_cache(cache_bucket, key)
-        if cached is not None:
-            console.print("[dim]Using cached result[/dim]")
-            return cached, True
+    With --no-cache the cached body is still revalidated: the stored
+    ETag/Last-Modified are sent along, and a 304 reuses the cached copy.
+    """
+    return _fetch_many_with_cache(
+        client,
+        [(cache_bucket, path, params)],
+        no_cache=no_cache,
+        cache_only=cache_only,
+        progress_label=progress_label,
+    )[0]
 
-    if cache_only:
-        console.print(f"[red]Not in cache: {path}[/red]")
-        raise click.Abort()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task(progress_label, total=None)
-        try:
-            result = client.get(path, params)
-        except Exception as exc:
-            console.print(f"[red]Error: {exc}[/red]")
+def _fetch_many_with_cache(
+    client: RedditClient,
+    fetches: list[tuple[str, str, dict[str, Any]]],
+    no_cache: bool,
+    cache_only: bool,
+    progress_label: str,
+) -> list[tuple[Any, bool]]:
+    """Fetch several (cache_bucket, path, params) listings at once.
+
+    Cache hits are answered immediately; misses are fetched concurrently
+    under a single spinner, so independent requests overlap on the wire.
+    Results come back in the order of fetches.
+    """
+    results: list[Any] = [None] * len(fetches)
+    misses: list[tuple[int, str, str, dict[str, Any], str]] = []
+
+    for idx, (cache_bucket, path, params) in enumerate(fetches):
+        key = cache_key(path, params)
+        if not no_cache:
+            cached = read_cache(cache_bucket, key)
+            if cached is not None:
+                console.print("[dim]Using cached result[/dim]")
+                results[idx] = (cached, True)
+                continue
+
+        if cache_only:
+            console.print(f"[red]Not in cache: {path}[/red]")
             raise click.Abort()
 
+        misses.append((idx, cache_bucket, path, params, key))
+
+    if misses:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=4,
+            transient=True,
+        ) as progress:
+            progress.add_task(progress_label, total=None)
+            try:
+                if len(misses) == 1:
+                    fetched = [_revalidate(client, *misses[0][1:])]
+                else:
+                    with ThreadPoolExecutor(max_workers=len(misses)) as pool:
+                        fetched = list(
+                            pool.map(
+                                lambda miss: _revalidate(client, *miss[1:]), misses
+                            )
+                        )
+            except Exception as exc:
+                console.print(f"[red]Error: {exc}[/red]")
+                raise click.Abort()
+
+        for (idx, *_), outcome in zip(misses, fetched):
+            if outcome[1]:
+                console.print("[dim]Not modified, using cached result[/dim]")
+            results[idx] = outcome
+
+    return results
+
+
+def _revalidate(
+    client: RedditClient,
+    cache_bucket: str,
+    path: str,
+    params: dict[str, Any],
+    key: str,
+) -> tuple[Any, bool]:
+    """Fetch one listing over the network and refresh its cache entry.
+
+    Sends the stored validators; returns (cached body, True) on a 304.
+    """
+    validators_bucket = f"{cache_bucket}-etag"
+    validators = read_cache(validators_bucket, key)
+
+    result, fresh = client.get_conditional(path, params, validators)
+    if result is None:
+        cached = read_cache(cache_bucket, key)
+        if cached is not None:
+            return cached, True
+        # Validators outlived the body; fetch it unconditionally.
+        result, fresh = client.get_conditional(path, params)
+
     write_cache(cache_bucket, key, result)
+    if fresh:
+        write_cache(validators_bucket, key, fresh)
     return result, False
 
 
@@ -246,6 +478,15 @@ def _print_next_after_hint(command: str, next_after: str, pretty: bool):
         print(hint)
 
 
+def _heading(text: str, pretty: bool):
+    """Print a section heading followed by a divider."""
+    if pretty:
+        console.print(f"[bold]{text}[/bold]")
+        console.print(_DIVIDER)
+    else:
+        print(f"{text}\n{_DIVIDER}")
+
+
 # ---------------------------------------------------------------------------
 # Display helpers
 # ---------------------------------------------------------------------------
@@ -262,30 +503,32 @@ def display_post_table(posts: list[dict]):
     table.add_column("Age", style="dim", max_width=8)
     table.add_column("Title")
 
+    now_ts = time.time()
+
     for idx, post in enumerate(posts, 1):
-        data = post.get("data", post)
-        sub = data.get("subreddit", "")
-        author = data.get("author", "[deleted]")
-        score = format_number(data.get("score", 0))
-        comments = format_number(data.get("num_comments", 0))
-        age = format_timestamp(data.get("created_utc"))
-        title = _truncate(data.get("title", ""), 74)
-        flair = data.get("link_flair_text")
+        sub, author, score, comments, created, title, flair, permalink = _row(
+            post.get("data", post), _POST_COLS, _POST_COLS_DEFAULTS
+        )
+        score = format_number(score)
+        comments = format_number(comments)
+        age = _format_age(created, now_ts)
+        title = _truncate(title, 74)
         if flair:
-            title = f"[{flair}] {title}"
+            title = _ROW_TITLE % (flair, title)
 
-        permalink = _absolute_reddit_url(data.get("permalink", ""))
-        title_cell = escape(title)
+        permalink = _absolute_reddit_url(permalink)
+        # Prebuilt Text cells skip Rich's markup parser at render time.
+        title_cell = Text(title)
         if permalink:
-            title_cell = f"[link={permalink}]{title_cell}[/link]"
+            title_cell.stylize(Style(link=permalink))
 
         table.add_row(
-            str(idx),
-            f"r/{sub}",
-            f"u/{author}",
-            score,
-            comments,
-            age,
+            Text(str(idx)),
+            Text(_ROW_SUB % sub),
+            Text(_ROW_AUTHOR % author),
+            Text(score),
+            Text(comments),
+            Text(age),
             title_cell,
         )
 
@@ -294,6 +537,8 @@ def display_post_table(posts: list[dict]):
 
 def display_post_lines(posts: list[dict]):
     """Display a list of posts as plain text lines."""
+    now_ts = time.time()
+    out: list[str] = []
     for idx, post in enumerate(posts, 1):
         data = post.get("data", post)
         title = data.get("title", "")
@@ -301,16 +546,21 @@ def display_post_lines(posts: list[dict]):
         author = data.get("author", "[deleted]")
         score = format_number(data.get("score", 0))
         comments = format_number(data.get("num_comments", 0))
-        age = format_timestamp(data.get("created_utc"))
+        age = _format_age(data.get("created_utc"), now_ts)
         permalink = _absolute_reddit_url(data.get("permalink", ""))
         snippet = _truncate(data.get("selftext", ""), 140)
 
-        print(f"{idx}. {title}")
-        print(f"   r/{sub} | u/{author} | {score} pts | {comments} comments | {age}")
+        out.append(f"{idx}. {title}")
+        out.append(
+            f"   r/{sub} | u/{author} | {score} pts | {comments} comments | {age}"
+        )
         if permalink:
-            print(f"   {permalink}")
+            out.append(f"   {permalink}")
         if snippet:
-            print(f"   {snippet}")
+            out.append(f"   {snippet}")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def display_post(post_data: dict, show_body: bool = True, pretty: bool = True):
@@ -335,7 +585,7 @@ def display_post(post_data: dict, show_body: bool = True, pretty: bool = True):
         if flair:
             console.print(f"[magenta][{flair}][/magenta]")
         console.print(
-            f"[cyan]r/{subreddit}[/cyan] | "
+            f"[cyan]r/{_safe_sub(subreddit)}[/cyan] | "
             f"[dim]u/{author}[/dim] | "
             f"[green]{score} pts[/green] | "
             f"[yellow]{comments_count} comments[/yellow] | "
@@ -372,50 +622,70 @@ def display_comment_tree(
     depth: int = 0,
     max_depth: int = 3,
     pretty: bool = True,
+    now_ts: Optional[float] = None,
 ):
-    """Recursively display a comment tree with indentation."""
-    for child in children:
+    """Display a comment tree with indentation.
+
+    Walks the tree with an explicit stack and emits all lines in one write.
+    """
+    if now_ts is None:
+        now_ts = time.time()
+    _ensure_prefixes(max(depth, max_depth))
+
+    lines: list[str] = []
+    stack = [(iter(children), depth)]
+    while stack:
+        level, level_depth = stack[-1]
+        child = next(level, None)
+        if child is None:
+            stack.pop()
+            continue
         if child.get("kind") != "t1":
             continue
 
         data = child.get("data", {})
         author = data.get("author", "[deleted]")
         score = format_number(data.get("score", 0))
-        age = format_timestamp(data.get("created_utc"))
+        age = _format_age(data.get("created_utc"), now_ts)
         body = data.get("body", "")
-        indent = "  " * depth
+        show_body = body and body != "[deleted]"
 
         if pretty:
-            bar = "[dim]|[/dim] " * depth
-            console.print(
-                f"{bar}[bold cyan]u/{author}[/bold cyan] "
+            bar = _BARS[level_depth]
+            lines.append(
+                f"{bar}[bold cyan]u/{escape(author)}[/bold cyan] "
                 f"[green]({score} pts)[/green] "
                 f"[dim]{age}[/dim]"
             )
-            if body and body != "[deleted]":
-                for line in body.split("\n"):
-                    if line.strip():
-                        console.print(f"{bar}  {line}")
-            console.print(f"{bar}")
+            if show_body:
+                lines.extend(
+                    f"{bar}  {escape(line)}"
+                    for line in body.split("\n")
+                    if line.strip()
+                )
+            lines.append(bar)
         else:
-            print(f"{indent}u/{author} ({score} pts) {age}")
-            if body and body != "[deleted]":
-                for line in body.split("\n"):
-                    if line.strip():
-                        print(f"{indent}  {line}")
-            print()
-
-        if depth < max_depth - 1:
+            indent = _INDENTS[level_depth]
+            lines.append(f"{indent}u/{author} ({score} pts) {age}")
+            if show_body:
+                lines.extend(
+                    f"{indent}  {line}" for line in body.split("\n") if line.strip()
+                )
+            lines.append("")
+
+        if level_depth < max_depth - 1:
             replies = data.get("replies")
             if replies and isinstance(replies, dict):
                 reply_children = replies.get("data", {}).get("children", [])
                 if reply_children:
-                    display_comment_tree(
-                        reply_children,
-                        depth=depth + 1,
-                        max_depth=max_depth,
-                        pretty=pretty,
-                    )
+                    stack.append((iter(reply_children), level_depth + 1))
+
+    if not lines:
+        return
+    if pretty:
+        console.print("\n".join(lines))
+    else:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_subreddit_about(data: dict, pretty: bool = True):
@@ -512,47 +782,54 @@ def display_user_about(data: dict, pretty: bool = True):
 
 def display_user_activity(items: list, pretty: bool = True):
     """Display a user's mixed activity (posts + comments)."""
+    now_ts = time.time()
+    out: list[str] = []
     for item in items:
         kind = item.get("kind", "")
         data = item.get("data", {})
 
         if kind == "t3":
-            sub = data.get("subreddit", "")
-            title = _truncate(data.get("title", ""), 80)
-            score = format_number(data.get("score", 0))
-            age = format_timestamp(data.get("created_utc"))
-            permalink = _absolute_reddit_url(data.get("permalink", ""))
+            sub, title, score, created, permalink = _row(
+                data, _POST_GET, _POST_DEFAULTS
+            )
+            title = _truncate(title, 80)
+            score = format_number(score)
+            age = _format_age(created, now_ts)
+            permalink = _absolute_reddit_url(permalink)
 
             if pretty:
                 console.print(
                     f"[bold blue][post][/bold blue] "
-                    f"[cyan]r/{sub}[/cyan] "
+                    f"[cyan]r/{_safe_sub(sub)}[/cyan] "
                     f"[green]{score} pts[/green] "
                     f"[dim]{age}[/dim]"
                 )
                 console.print(f"  {title}")
                 if permalink:
                     console.print(f"  [dim]{permalink}[/dim]")
+                print()
             else:
-                print(f"[post] r/{sub} {score} pts {age}")
-                print(f"  {title}")
+                out.append(f"[post] r/{sub} {score} pts {age}")
+                out.append(f"  {title}")
                 if permalink:
-                    print(f"  {permalink}")
-            print()
+                    out.append(f"  {permalink}")
+                out.append("")
             continue
 
         if kind == "t1":
-            sub = data.get("subreddit", "")
-            body = _truncate(data.get("body", ""), 120)
-            score = format_number(data.get("score", 0))
-            age = format_timestamp(data.get("created_utc"))
-            link_title = _truncate(data.get("link_title", ""), 60)
-            permalink = _absolute_reddit_url(data.get("permalink", ""))
+            sub, body, score, created, link_title, permalink = _row(
+                data, _COMMENT_GET, _COMMENT_DEFAULTS
+            )
+            body = _truncate(body, 120)
+            score = format_number(score)
+            age = _format_age(created, now_ts)
+            link_title = _truncate(link_title, 60)
+            permalink = _absolute_reddit_url(permalink)
 
             if pretty:
                 console.print(
                     f"[bold yellow][comment][/bold yellow] "
-                    f"[cyan]r/{sub}[/cyan] "
+                    f"[cyan]r/{_safe_sub(sub)}[/cyan] "
                     f"[green]{score} pts[/green] "
                     f"[dim]{age}[/dim]"
                 )
@@ -561,14 +838,18 @@ def display_user_activity(items: list, pretty: bool = True):
                 console.print(f"  {body}")
                 if permalink:
                     console.print(f"  [dim]{permalink}[/dim]")
+                print()
             else:
-                print(f"[comment] r/{sub} {score} pts {age}")
+                out.append(f"[comment] r/{sub} {score} pts {age}")
                 if link_title:
-                    print(f"  on: {link_title}")
-                print(f"  {body}")
+                    out.append(f"  on: {link_title}")
+                out.append(f"  {body}")
                 if permalink:
-                    print(f"  {permalink}")
-            print()
+                    out.append(f"  {permalink}")
+                out.append("")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -576,6 +857,48 @@ def display_user_activity(items: list, pretty: bool = True):
 # ---------------------------------------------------------------------------
 
 
+# "meta" blocks of the JSON envelopes. orjson encodes slotted dataclasses
+# directly, in field order, so these serialize exactly like the dict
+# literals they replace while fixing each command's set of keys.
+
+
+@dataclass(slots=True)
+class PostMeta:
+    sort: str
+    depth: int
+    limit: int
+    no_comments: bool
+    from_cache: bool
+    returned_top_level: int
+
+
+@dataclass(slots=True)
+class SearchMeta:
+    count: int
+    next_after: Optional[str]
+    from_cache: bool
+
+
+@dataclass(slots=True)
+class SubredditMeta:
+    count: int
+    next_after: Optional[str]
+    pages: int
+    from_cache: bool
+
+
+@dataclass(slots=True)
+class UserMeta:
+    count: int
+    next_after: Optional[str]
+    from_cache: dict[str, Optional[bool]]
+
+
+@dataclass(slots=True)
+class CacheMeta:
+    from_cache: bool
+
+
 def post_to_dict(data: dict) -> dict:
     """Convert Reddit post data to a JSON-friendly dict."""
     d = data.get("data", data)
@@ -601,12 +924,39 @@ def comment_to_dict(
     max_depth: int = 3,
     depth: int = 0,
 ) -> Optional[dict]:
-    """Convert Reddit comment to dict, recursively including replies."""
+    """Convert Reddit comment to dict, including replies down to max_depth.
+
+    Walks the reply tree with an explicit stack, so deep threads cannot hit
+    the recursion limit.
+    """
     if child.get("kind") != "t1":
         return None
 
-    data = child.get("data", {})
-    result = {
+    root = _comment_fields(child.get("data", {}), depth)
+    last_level = max_depth - 1
+    stack = [(child, root, depth)]
+    while stack:
+        node, result, node_depth = stack.pop()
+        if node_depth >= last_level:
+            continue
+        replies = node.get("data", {}).get("replies")
+        if not replies or not isinstance(replies, dict):
+            continue
+
+        reply_dicts = result["replies"] = []
+        for reply in replies.get("data", {}).get("children", []):
+            if reply.get("kind") != "t1":
+                continue
+            reply_dict = _comment_fields(reply.get("data", {}), node_depth + 1)
+            reply_dicts.append(reply_dict)
+            stack.append((reply, reply_dict, node_depth + 1))
+
+    return root
+
+
+def _comment_fields(data: dict, depth: int) -> dict:
+    """Project a single comment's fields (without replies)."""
+    return {
         "id": data.get("id"),
         "author": data.get("author"),
         "subreddit": data.get("subreddit"),
@@ -618,21 +968,6 @@ def comment_to_dict(
         "depth": depth,
     }
 
-    if depth < max_depth - 1:
-        replies = data.get("replies")
-        if replies and isinstance(replies, dict):
-            reply_children = replies.get("data", {}).get("children", [])
-            result["replies"] = [
-                c
-                for c in (
-                    comment_to_dict(reply, max_depth=max_depth, depth=depth + 1)
-                    for reply in reply_children
-                )
-                if c is not None
-            ]
-
-    return result
-
 
 def user_to_dict(data: dict) -> dict:
     """Convert user about data to dict."""
@@ -694,6 +1029,20 @@ def activity_item_to_dict(item: dict) -> Optional[dict]:
     return None
 
 
+def _posts_payload(posts: list[dict], raw: bool) -> list[dict]:
+    """Project posts for JSON output, or pass raw Reddit data through."""
+    if raw:
+        return [post.get("data", post) for post in posts]
+    return [post_to_dict(post) for post in posts]
+
+
+def _profile_payload(data: dict, raw: bool) -> dict:
+    """Project a user profile for JSON output, or pass raw Reddit data through."""
+    if raw:
+        return data.get("data", data)
+    return user_to_dict(data)
+
+
 # ---------------------------------------------------------------------------
 # Click command group
 # ---------------------------------------------------------------------------
@@ -743,6 +1092,7 @@ def reddit():
 @click.option("--after", default=None, help="Pagination cursor from previous result")
 @click.option("-o", "--output", help="Save output to file")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.option("--raw", is_flag=True, help="Output full Reddit JSON (with --json/-o)")
 @click.option("--pretty/--no-pretty", default=None, help="Pretty print output")
 @click.option(
     "--no-cache", "no_cache", is_flag=True, help="Bypass cache, force fresh fetch"
@@ -758,6 +1108,7 @@ def reddit_search(
     after: Optional[str],
     output: Optional[str],
     json_output: bool,
+    raw: bool,
     pretty: Optional[bool],
     no_cache: bool,
     cache_only: bool,
@@ -769,6 +1120,7 @@ def reddit_search(
         fcrawl reddit search "python async"
         fcrawl reddit search "hooks" -s ClaudeCode --sort top
         fcrawl reddit search "mcp server" --user spez --time week -l 10
+        fcrawl reddit search "python async" --json --raw
     """
     pretty = resolve_pretty(pretty)
 
@@ -839,12 +1191,12 @@ def reddit_search(
                 "time": time_filter,
                 "after": after,
             },
-            "results": [post_to_dict(p) for p in posts],
-            "meta": {
-                "count": len(posts),
-                "next_after": next_after,
-                "from_cache": from_cache,
-            },
+            "results": _posts_payload(posts, raw),
+            "meta": SearchMeta(
+                count=len(posts),
+                next_after=next_after,
+                from_cache=from_cache,
+            ),
         }
         _print_json_or_save(output_data, output, json_output, pretty)
         return
@@ -892,6 +1244,7 @@ def reddit_search(
 )
 @click.option("-o", "--output", help="Save output to file")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.option("--raw", is_flag=True, help="Output full Reddit JSON (with --json/-o)")
 @click.option("--pretty/--no-pretty", default=None, help="Pretty print output")
 @click.option(
     "--no-cache", "no_cache", is_flag=True, help="Bypass cache, force fresh fetch"
@@ -905,6 +1258,7 @@ def reddit_post(
     no_comments: bool,
     output: Optional[str],
     json_output: bool,
+    raw: bool,
     pretty: Optional[bool],
     no_cache: bool,
     cache_only: bool,
@@ -927,7 +1281,7 @@ def reddit_post(
     client = RedditClient()
 
     try:
-        path = _parse_post_target(url_or_id, client=client)
+        path = _parse_post_target(url_or_id, client=client, use_cache=not no_cache)
     except ValueError as exc:
         console.print(f"[red]{exc}[/red]")
         raise click.Abort()
@@ -938,9 +1292,11 @@ def reddit_post(
     elif limit > 0:
         params["limit"] = limit
 
+    # Post-only fetches are keyed apart from full threads so the two never
+    # share (or evict) each other's cache entries.
     result, from_cache = _fetch_with_cache(
         client=client,
-        cache_bucket="reddit-post",
+        cache_bucket="reddit-post-nocomments" if no_comments else "reddit-post",
         path=path,
         params=params,
         no_cache=no_cache,
@@ -948,55 +1304,66 @@ def reddit_post(
         progress_label="Fetching post...",
     )
 
-    if not isinstance(result, list) or len(result) < 2:
+    # --no-comments only needs the post listing; the comment listing is
+    # never looked at, so the comment branches below see an empty thread.
+    listings_needed = 1 if no_comments else 2
+    if not isinstance(result, list) or len(result) < listings_needed:
         console.print("[red]Unexpected response format[/red]")
         raise click.Abort()
 
     post_children = result[0].get("data", {}).get("children", [])
-    comment_children = result[1].get("data", {}).get("children", [])
+    comment_children = (
+        [] if no_comments else result[1].get("data", {}).get("children", [])
+    )
 
     if not post_children:
         console.print("[yellow]Post not found[/yellow]")
         return
 
     post = post_children[0]
-    comments_payload = []
-    if not no_comments:
-        comments_payload = [
-            comment
-            for comment in (
-                comment_to_dict(child, max_depth=depth) for child in comment_children
-            )
-            if comment is not None
-        ]
 
     if json_output or output:
+        # Comments are projected only here; the display path below renders
+        # the raw children directly, so no comment dict is built twice.
+        # Raw mode forwards Reddit's own comment tree, skipping the
+        # comment_to_dict recursion entirely.
+        comments_payload: Iterable[Any] = comment_children
+        if not raw:
+            comments_payload = (
+                comment
+                for child in comment_children
+                if (comment := comment_to_dict(child, max_depth=depth)) is not None
+            )
+
+        post_payload = post.get("data", post) if raw else post_to_dict(post)
+        meta = PostMeta(
+            sort=sort,
+            depth=depth,
+            limit=limit,
+            no_comments=no_comments,
+            from_cache=from_cache,
+            returned_top_level=len(comment_children),
+        )
+        if output:
+            # Encode one top-level thread at a time so large trees are never
+            # held as a fully projected list.
+            save_to_file(
+                _iter_post_json(post_payload, comments_payload, meta, pretty),
+                output,
+                "json",
+            )
+            return
         output_data = {
-            "post": post_to_dict(post),
-            "comments": comments_payload,
-            "meta": {
-                "sort": sort,
-                "depth": depth,
-                "limit": limit,
-                "no_comments": no_comments,
-                "from_cache": from_cache,
-                "returned_top_level": len(comment_children),
-            },
+            "post": post_payload,
+            "comments": list(comments_payload),
+            "meta": meta,
         }
         _print_json_or_save(output_data, output, json_output, pretty)
         return
 
     display_post(post, show_body=True, pretty=pretty)
-    if no_comments:
-        return
-
     if comment_children:
-        if pretty:
-            console.print("[bold]Comments[/bold]")
-            console.print("-" * 40)
-        else:
-            print("Comments")
-            print("-" * 40)
+        _heading("Comments", pretty)
         display_comment_tree(comment_children, depth=0, max_depth=depth, pretty=pretty)
 
 
@@ -1025,9 +1392,16 @@ def reddit_post(
     "--limit", "-l", type=int, default=20, help="Max posts (default: 20, max: 100)"
 )
 @click.option("--after", default=None, help="Pagination cursor from previous result")
+@click.option(
+    "--pages",
+    type=int,
+    default=1,
+    help="Follow the pagination cursor for this many pages (default: 1)",
+)
 @click.option("--about", is_flag=True, help="Show subreddit info instead of feed")
 @click.option("-o", "--output", help="Save output to file")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.option("--raw", is_flag=True, help="Output full Reddit JSON (with --json/-o)")
 @click.option("--pretty/--no-pretty", default=None, help="Pretty print output")
 @click.option(
     "--no-cache", "no_cache", is_flag=True, help="Bypass cache, force fresh fetch"
@@ -1039,9 +1413,11 @@ def reddit_subreddit(
     time_filter: str,
     limit: int,
     after: Optional[str],
+    pages: int,
     about: bool,
     output: Optional[str],
     json_output: bool,
+    raw: bool,
     pretty: Optional[bool],
     no_cache: bool,
     cache_only: bool,
@@ -1053,45 +1429,35 @@ def reddit_subreddit(
         fcrawl reddit subreddit python
         fcrawl reddit subreddit ClaudeCode --sort top --time week
         fcrawl reddit subreddit python --after t3_1abc234
+        fcrawl reddit subreddit python -l 100 --pages 3
     """
     pretty = resolve_pretty(pretty)
 
     if limit < 1:
         raise click.BadParameter("limit must be >= 1", param_hint="--limit")
+    if pages < 1:
+        raise click.BadParameter("pages must be >= 1", param_hint="--pages")
 
     limit = min(limit, 100)
     subreddit_name = _normalize_subreddit(name)
     client = RedditClient()
 
     if about:
-        path = f"r/{subreddit_name}/about"
-        params: dict[str, Any] = {}
-        label = f"Fetching r/{subreddit_name} info..."
-        cache_bucket = "reddit-subreddit-about"
-    else:
-        path = f"r/{subreddit_name}/{sort}"
-        params = {"t": time_filter, "limit": limit}
-        if after:
-            params["after"] = after
-        label = f"Fetching r/{subreddit_name}/{sort}..."
-        cache_bucket = "reddit-subreddit-feed"
-
-    result, from_cache = _fetch_with_cache(
-        client=client,
-        cache_bucket=cache_bucket,
-        path=path,
-        params=params,
-        no_cache=no_cache,
-        cache_only=cache_only,
-        progress_label=label,
-    )
+        result, from_cache = _fetch_with_cache(
+            client=client,
+            cache_bucket="reddit-subreddit-about",
+            path=f"r/{subreddit_name}/about",
+            params={},
+            no_cache=no_cache,
+            cache_only=cache_only,
+            progress_label=f"Fetching r/{subreddit_name} info...",
+        )
 
-    if about:
-        payload = subreddit_to_dict(result)
+        payload = result.get("data", result) if raw else subreddit_to_dict(result)
         if json_output or output:
             output_data = {
                 "subreddit": payload,
-                "meta": {"from_cache": from_cache},
+                "meta": CacheMeta(from_cache=from_cache),
             }
             _print_json_or_save(output_data, output, json_output, pretty)
             return
@@ -1099,9 +1465,39 @@ def reddit_subreddit(
         display_subreddit_about(result, pretty=pretty)
         return
 
-    listing = result.get("data", {})
-    posts = listing.get("children", [])
-    next_after = listing.get("after")
+    # Listing pages are chained through the `after` cursor, so they are
+    # fetched in order over the client's one keep-alive session; each page
+    # is cached under its own cursor.
+    posts: list[dict] = []
+    next_after = after
+    from_cache = True
+    pages_fetched = 0
+    for page in range(1, pages + 1):
+        params: dict[str, Any] = {"t": time_filter, "limit": limit}
+        if next_after:
+            params["after"] = next_after
+        label = f"Fetching r/{subreddit_name}/{sort}..."
+        if pages > 1:
+            label = f"Fetching r/{subreddit_name}/{sort} (page {page}/{pages})..."
+
+        result, page_from_cache = _fetch_with_cache(
+            client=client,
+            cache_bucket="reddit-subreddit-feed",
+            path=f"r/{subreddit_name}/{sort}",
+            params=params,
+            no_cache=no_cache,
+            cache_only=cache_only,
+            progress_label=label,
+        )
+        from_cache = from_cache and page_from_cache
+        pages_fetched += 1
+
+        listing = result.get("data", {})
+        posts.extend(listing.get("children", []))
+        next_after = listing.get("after")
+        if not next_after:
+            break
+
     if not posts:
         console.print(f"[yellow]No posts found in r/{subreddit_name}[/yellow]")
         return
@@ -1113,12 +1509,13 @@ def reddit_subreddit(
             "subreddit": subreddit_name,
             "sort": sort,
             "time": time_filter,
-            "results": [post_to_dict(post) for post in posts],
-            "meta": {
-                "count": len(posts),
-                "next_after": next_after,
-                "from_cache": from_cache,
-            },
+            "results": _posts_payload(posts, raw),
+            "meta": SubredditMeta(
+                count=len(posts),
+                next_after=next_after,
+                pages=pages_fetched,
+                from_cache=from_cache,
+            ),
         }
         _print_json_or_save(output_data, output, json_output, pretty)
         return
@@ -1173,6 +1570,7 @@ def reddit_subreddit(
 @click.option("--after", default=None, help="Pagination cursor from previous result")
 @click.option("-o", "--output", help="Save output to file")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.option("--raw", is_flag=True, help="Output full Reddit JSON (with --json/-o)")
 @click.option("--pretty/--no-pretty", default=None, help="Pretty print output")
 @click.option(
     "--no-cache", "no_cache", is_flag=True, help="Bypass cache, force fresh fetch"
@@ -1190,6 +1588,7 @@ def reddit_user(
     after: Optional[str],
     output: Optional[str],
     json_output: bool,
+    raw: bool,
     pretty: Optional[bool],
     no_cache: bool,
     cache_only: bool,
@@ -1232,11 +1631,11 @@ def reddit_user(
             progress_label=f"Fetching u/{user_name} profile...",
         )
 
-        payload = user_to_dict(profile_data)
+        payload = _profile_payload(profile_data, raw)
         if json_output or output:
             output_data = {
                 "profile": payload,
-                "meta": {"from_cache": profile_from_cache},
+                "meta": CacheMeta(from_cache=profile_from_cache),
             }
             _print_json_or_save(output_data, output, json_output, pretty)
             return
@@ -1244,17 +1643,6 @@ def reddit_user(
         display_user_about(profile_data, pretty=pretty)
         return
 
-    if activity_type == "overview":
-        profile_data, profile_from_cache = _fetch_with_cache(
-            client=client,
-            cache_bucket="reddit-user-about",
-            path=f"user/{user_name}/about",
-            params={},
-            no_cache=no_cache,
-            cache_only=cache_only,
-            progress_label=f"Fetching u/{user_name} profile...",
-        )
-
     activity_params: dict[str, Any] = {
         "sort": sort,
         "t": time_filter,
@@ -1263,15 +1651,30 @@ def reddit_user(
     if after:
         activity_params["after"] = after
 
-    activity_data, activity_from_cache = _fetch_with_cache(
-        client=client,
-        cache_bucket="reddit-user-activity",
-        path=f"user/{user_name}/{activity_type}",
-        params=activity_params,
-        no_cache=no_cache,
-        cache_only=cache_only,
-        progress_label=f"Fetching u/{user_name} activity...",
+    activity_fetch = (
+        "reddit-user-activity",
+        f"user/{user_name}/{activity_type}",
+        activity_params,
     )
+    if activity_type == "overview":
+        # Profile and activity are independent; fetch them side by side.
+        profile_result, activity_result = _fetch_many_with_cache(
+            client,
+            [("reddit-user-about", f"user/{user_name}/about", {}), activity_fetch],
+            no_cache=no_cache,
+            cache_only=cache_only,
+            progress_label=f"Fetching u/{user_name} profile and activity...",
+        )
+        profile_data, profile_from_cache = profile_result
+        activity_data, activity_from_cache = activity_result
+    else:
+        activity_data, activity_from_cache = _fetch_with_cache(
+            client,
+            *activity_fetch,
+            no_cache=no_cache,
+            cache_only=cache_only,
+            progress_label=f"Fetching u/{user_name} activity...",
+        )
 
     listing = activity_data.get("data", {})
     items = listing.get("children", [])
@@ -1288,32 +1691,31 @@ def reddit_user(
             "type": activity_type,
             "sort": sort,
             "time": time_filter,
-            "profile": user_to_dict(profile_data) if profile_data else None,
-            "activity": [
-                item
-                for item in (activity_item_to_dict(activity) for activity in items)
-                if item is not None
-            ],
-            "meta": {
-                "count": len(items),
-                "next_after": next_after,
-                "from_cache": {
+            "profile": _profile_payload(profile_data, raw) if profile_data else None,
+            "activity": (
+                items
+                if raw
+                else [
+                    item
+                    for activity in items
+                    if (item := activity_item_to_dict(activity)) is not None
+                ]
+            ),
+            "meta": UserMeta(
+                count=len(items),
+                next_after=next_after,
+                from_cache={
                     "profile": profile_from_cache,
                     "activity": activity_from_cache,
                 },
-            },
+            ),
         }
         _print_json_or_save(output_data, output, json_output, pretty)
         return
 
     if profile_data is not None:
         display_user_about(profile_data, pretty=pretty)
-        if pretty:
-            console.print("[bold]Recent Activity[/bold]")
-            console.print("-" * 40)
-        else:
-            print("Recent Activity")
-            print("-" * 40)
+        _heading("Recent Activity", pretty)
 
     display_user_activity(items, pretty=pretty)
 
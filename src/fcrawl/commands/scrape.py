@@ -1,7 +1,9 @@
 """Scrape command for fcrawl"""
 
 import hashlib
+import io
 import re
+import sys
 import time
 import click
 import requests
@@ -10,7 +12,7 @@ from pathlib import Path
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from types import SimpleNamespace
 from rich.console import Console
-from typing import List, Optional, Tuple
+from typing import IO, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..utils.config import get_firecrawl_client
@@ -31,7 +33,7 @@ from ..utils.cache import (
 
 
 # Article mode: aggressive filtering for clean article extraction
-ARTICLE_INCLUDE_TAGS = [
+ARTICLE_INCLUDE_TAGS = (
     "article",
     "main",
     ".post-content",
@@ -43,9 +45,9 @@ ARTICLE_INCLUDE_TAGS = [
     "#content",
     "#article",
     "[role='main']",
-]
+)
 
-ARTICLE_EXCLUDE_TAGS = [
+ARTICLE_EXCLUDE_TAGS = (
     "nav",
     "header",
     "footer",
@@ -72,7 +74,39 @@ ARTICLE_EXCLUDE_TAGS = [
     ".banner",
     ".promo",
     ".cta",
-]
+)
+
+# Article mode: line patterns dropped from cleaned markdown
+ARTICLE_SKIP_PATTERNS = (
+    r"^Close$",  # Popup close buttons
+    r"^\s*\*\s*\[\s*\]\(https?://(www\.)?(twitter|facebook|linkedin|reddit|pinterest|x\.com)",  # Empty share links
+    r"^\s*\*\s*\[.*\]\(https?://(www\.)?(twitter\.com/share|facebook\.com/sharer|linkedin\.com/share|reddit\.com/submit)",  # Share links with text
+    r"^Share (on|this|article)",  # Share text
+    r"^(Tweet|Pin|Share|Follow us)",  # Social CTAs
+    r"^\s*US\s*$",  # Random country codes from popups
+    r"^Start Now$",  # CTA buttons
+    r"^Subscribe",  # Newsletter prompts
+    r"^Sign up",  # Sign up prompts
+    r"^\s*$",  # Empty lines at start (will be handled by consecutive empty check)
+)
+
+# All skip patterns fused into one alternation, compiled once at import
+_SKIP_RE = re.compile(
+    "|".join(f"(?:{p})" for p in ARTICLE_SKIP_PATTERNS), re.IGNORECASE
+)
+
+# Same alternation for scanning a whole document at once: MULTILINE anchors
+# match at line boundaries and \s may not run past the end of a line.
+_SKIP_LINE_RE = re.compile(
+    _SKIP_RE.pattern.replace(r"\s", r"[^\S\n]"), re.IGNORECASE | re.MULTILINE
+)
+
+# Sentinel for attributes that may legitimately hold None
+_MISSING = object()
+
+# Result attribute holding each directly returned format; "links" is derived
+# from the markdown client-side instead.
+_FORMAT_ATTR = {"markdown": "markdown", "html": "html"}
 
 DEFAULT_SCRAPE_TIMEOUT = 12
 DEFAULT_JINA_FALLBACK_DELAY = 5
@@ -257,65 +291,75 @@ def announce_saved_result(
 
 def clean_article_content(content: str) -> str:
     """Post-process markdown to remove common noise patterns"""
-    lines = content.split("\n")
-    cleaned_lines = []
-
-    # Patterns to skip
-    skip_patterns = [
-        r"^Close$",  # Popup close buttons
-        r"^\s*\*\s*\[\s*\]\(https?://(www\.)?(twitter|facebook|linkedin|reddit|pinterest|x\.com)",  # Empty share links
-        r"^\s*\*\s*\[.*\]\(https?://(www\.)?(twitter\.com/share|facebook\.com/sharer|linkedin\.com/share|reddit\.com/submit)",  # Share links with text
-        r"^Share (on|this|article)",  # Share text
-        r"^(Tweet|Pin|Share|Follow us)",  # Social CTAs
-        r"^\s*US\s*$",  # Random country codes from popups
-        r"^Start Now$",  # CTA buttons
-        r"^Subscribe",  # Newsletter prompts
-        r"^Sign up",  # Sign up prompts
-        r"^\s*$",  # Empty lines at start (will be handled by consecutive empty check)
-    ]
-
-    skip_regex = [re.compile(p, re.IGNORECASE) for p in skip_patterns]
-
-    # Track consecutive empty lines
-    prev_empty = False
-
-    for line in lines:
-        # Check if line matches any skip pattern
-        should_skip = any(r.search(line) for r in skip_regex)
-
-        if should_skip:
-            continue
+    buffer = io.StringIO()
+    clean_article_content_stream(content, buffer)
+    return buffer.getvalue()
 
-        # Collapse multiple empty lines
-        is_empty = line.strip() == ""
-        if is_empty and prev_empty:
-            continue
 
-        cleaned_lines.append(line)
-        prev_empty = is_empty
+def clean_article_content_stream(content: str, sink: IO[str]) -> None:
+    """Write the kept lines of clean_article_content(content) to sink.
 
-    return "\n".join(cleaned_lines)
+    Nothing beyond the pieces being written is buffered, so article output
+    can go straight to a file without holding a cleaned copy in memory.
+    """
+    # One pass over the whole document; every pattern is anchored with ^,
+    # so each match starts exactly at the offset of a line to drop. Kept
+    # text is then written out as slices between dropped lines.
+    #
+    # Blank lines always match ^\s*$, so no kept line is ever empty and
+    # there are no consecutive empty lines left to collapse.
+    #
+    # The last kept line may be followed by a dropped one, whose separator
+    # must not be emitted; each piece's trailing newline is therefore held
+    # back until more text follows it.
+    pending = ""
+    pos = 0
+    for match in _SKIP_LINE_RE.finditer(content):
+        start = match.start()
+        if start < pos:
+            continue
+        if start > pos:
+            sink.write(pending)
+            pending = "\n" if content[start - 1] == "\n" else ""
+            sink.write(content[pos : start - len(pending)])
+        end = content.find("\n", start)
+        pos = len(content) if end == -1 else end + 1
+    if pos < len(content):
+        sink.write(pending)
+        sink.write(content[pos:-1] if content.endswith("\n") else content[pos:])
+
+
+def save_article_stream(result, markdown: str, filepath: str) -> None:
+    """Save cleaned article markdown, with its metadata header, to filepath"""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(format_with_metadata(result, ""))
+        clean_article_content_stream(markdown, f)
 
 
 def format_with_metadata(result, content: str) -> str:
     """Prepend metadata header to content (like Jina's r.jina.ai output)"""
     header_lines = []
 
-    if hasattr(result, "source_provider") and result.source_provider:
-        header_lines.append(f"Source Provider: {result.source_provider}")
-    if hasattr(result, "fallback_url") and result.fallback_url:
-        header_lines.append(f"Fallback URL: {result.fallback_url}")
-
-    if hasattr(result, "metadata") and result.metadata:
-        md = result.metadata
-        if hasattr(md, "title") and md.title:
-            header_lines.append(f"Title: {md.title}")
-        if hasattr(md, "source_url") and md.source_url:
-            header_lines.append(f"URL Source: {md.source_url}")
-        elif hasattr(md, "url") and md.url:
-            header_lines.append(f"URL Source: {md.url}")
-        if hasattr(md, "published_time") and md.published_time:
-            header_lines.append(f"Published Time: {md.published_time}")
+    source_provider = getattr(result, "source_provider", None)
+    if source_provider:
+        header_lines.append(f"Source Provider: {source_provider}")
+    fallback_url = getattr(result, "fallback_url", None)
+    if fallback_url:
+        header_lines.append(f"Fallback URL: {fallback_url}")
+
+    md = getattr(result, "metadata", None)
+    if md:
+        title = getattr(md, "title", None)
+        if title:
+            header_lines.append(f"Title: {title}")
+        source_url = getattr(md, "source_url", None) or getattr(md, "url", None)
+        if source_url:
+            header_lines.append(f"URL Source: {source_url}")
+        published_time = getattr(md, "published_time", None)
+        if published_time:
+            header_lines.append(f"Published Time: {published_time}")
 
     if header_lines:
         return "\n".join(header_lines) + "\n\nMarkdown Content:\n" + content
@@ -438,6 +482,7 @@ def scrape(
         scrape_options["only_main_content"] = False
     elif article:
         # Aggressive article mode
+        # The SDK's option models expect lists; copy the immutable tag tuples
         scrape_options["include_tags"] = list(ARTICLE_INCLUDE_TAGS)
         scrape_options["exclude_tags"] = list(ARTICLE_EXCLUDE_TAGS)
         scrape_options["only_main_content"] = False  # We handle filtering ourselves
@@ -487,6 +532,8 @@ def scrape(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             progress.add_task(f"Scraping {url}...", total=None)
 
@@ -517,10 +564,31 @@ def scrape(
         raise click.Abort()
 
     # Handle output AFTER progress is done
+    # Article markdown that is only written to a file (not displayed, copied,
+    # link-stripped or JSON-wrapped) can be cleaned straight into the file.
+    stream_article = bool(
+        article
+        and output_path
+        and not (json_output or no_links or copy)
+        and (save_temp or not sys.stdout.isatty())
+    )
+    streamed = False
     if len(formats) == 1:
         format_type = formats[0]
-        if format_type == "markdown" and hasattr(result, "markdown"):
-            content = getattr(result, "markdown", "") or ""
+        if format_type == "links":
+            # Extract links from markdown content (client-side)
+            md_content = getattr(result, "markdown", "") or ""
+            content = extract_markdown_links(md_content)
+        else:
+            # Unknown formats map to "", which no result has as an attribute
+            value = getattr(result, _FORMAT_ATTR.get(format_type, ""), _MISSING)
+            content = result if value is _MISSING else value or ""
+        if format_type == "markdown" and content is not result and stream_article:
+            # Cleaned lines go straight to the file; the cleaned article is
+            # never assembled as one string.
+            save_article_stream(result, content, output_path)
+            streamed = True
+        elif format_type == "markdown" and content is not result:
             # Article mode: apply post-processing cleanup
             if article:
                 content = clean_article_content(content)
@@ -530,48 +598,41 @@ def scrape(
             # Prepend metadata header (like Jina) unless JSON output
             if not json_output:
                 content = format_with_metadata(result, content)
-        elif format_type == "html" and hasattr(result, "html"):
-            content = getattr(result, "html", "") or ""
-        elif format_type == "links":
-            # Extract links from markdown content (client-side)
-            md_content = getattr(result, "markdown", "") or ""
-            content = extract_markdown_links(md_content)
-        else:
-            content = result
     else:
         content = {}
-        if "markdown" in formats and hasattr(result, "markdown"):
-            content["markdown"] = getattr(result, "markdown", "") or ""
-        if "html" in formats and hasattr(result, "html"):
-            content["html"] = getattr(result, "html", "") or ""
+        for fmt, attr in _FORMAT_ATTR.items():
+            if fmt in formats:
+                value = getattr(result, attr, _MISSING)
+                if value is not _MISSING:
+                    content[fmt] = value or ""
         if "links" in formats:
             # Extract links from markdown content (client-side)
             md_content = getattr(result, "markdown", "") or ""
             content["links"] = extract_markdown_links(md_content)
-        if hasattr(result, "metadata"):
-            metadata = getattr(result, "metadata", None)
-            content["metadata"] = (
-                metadata.__dict__
-                if metadata is not None and hasattr(metadata, "__dict__")
-                else metadata
-            )
-        if hasattr(result, "source_provider") and getattr(
-            result, "source_provider", None
-        ):
-            content["source_provider"] = getattr(result, "source_provider")
-        if hasattr(result, "fallback_url") and getattr(result, "fallback_url", None):
-            content["fallback_url"] = getattr(result, "fallback_url")
-
-    handle_output(
-        content,
-        output_file=output_path,
-        copy=copy,
-        json_output=json_output,
-        pretty=pretty,
-        format_type=formats[0] if len(formats) == 1 else "json",
-        display_output=not save_temp,
-        announce_saved=not save_temp,
-    )
+        metadata = getattr(result, "metadata", _MISSING)
+        if metadata is not _MISSING:
+            content["metadata"] = getattr(metadata, "__dict__", metadata)
+        source_provider = getattr(result, "source_provider", None)
+        if source_provider:
+            content["source_provider"] = source_provider
+        fallback_url = getattr(result, "fallback_url", None)
+        if fallback_url:
+            content["fallback_url"] = fallback_url
+
+    if streamed:
+        if not save_temp:
+            console.print(f"[green]✓ Saved to {output_path}[/green]")
+    else:
+        handle_output(
+            content,
+            output_file=output_path,
+            copy=copy,
+            json_output=json_output,
+            pretty=pretty,
+            format_type=formats[0] if len(formats) == 1 else "json",
+            display_output=not save_temp,
+            announce_saved=not save_temp,
+        )
 
     if save_temp and output_path:
         announce_saved_result(
@@ -1,32 +1,107 @@
 """Search command powered by Serper.dev API."""
 
+import functools
 import os
+import sys
 import time
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from typing import Iterator, Optional
 
 import click
+import orjson
 import requests
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from requests.adapters import HTTPAdapter
+from rich.markup import escape
+from urllib3.util.retry import Retry
 
 from ..utils.cache import cache_key, read_cache, write_cache
 from ..utils.config import load_config
-from ..utils.output import console, handle_output, resolve_pretty
+from ..utils.output import console, emit_json, handle_output, resolve_pretty
 
 
 SERPER_ENDPOINT = "https://google.serper.dev/search"
 SERPER_MAX_RESULTS_PER_PAGE = 100
+SERPER_MAX_CONCURRENT_PAGES = 8
+# Queries run side by side when reading a batch from stdin (query "-")
+SERPER_MAX_CONCURRENT_QUERIES = 4
+# Ceiling on one Serper response body; 100 hits are far below this
+SERPER_MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+# Results fetched to check whether a stale cache entry still matches Google
+SERPER_PROBE_SIZE = 10
+
+# Shared by every result; encodes as ["google"] like a list would
+_GOOGLE_ENGINES = ("google",)
+
+_DIVIDER = "=" * 60
+
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session for Serper, created on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        # Searches are reads, so POSTs are safe to retry on 429 and 5xx; the
+        # last response is returned (not raised) so API errors stay readable.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        session.mount(
+            "https://google.serper.dev",
+            HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=SERPER_MAX_CONCURRENT_PAGES
+                * SERPER_MAX_CONCURRENT_QUERIES,
+                max_retries=retry,
+            ),
+        )
+        _SESSION = session
+    return _SESSION
+
+
+@dataclass(slots=True)
+class CachedSearch:
+    """A Serper search as stored in the "search" cache bucket."""
+
+    results: list[dict] = field(default_factory=list)
+    elapsed: float = 0.0
+    engine: str = "serper"
+    gl: str = "us"
+    hl: str = "en"
+    pages: int = 0
+    location: Optional[str] = None
+    extras: dict = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedSearch":
+        """Build from a cache entry, ignoring keys this version does not know."""
+        known = {name: data[name] for name in _CACHED_SEARCH_FIELDS if name in data}
+        return cls(**known)
+
+
+_CACHED_SEARCH_FIELDS = tuple(f.name for f in fields(CachedSearch))
 
 
+@functools.lru_cache(maxsize=1)
 def _get_serper_api_key() -> str:
-    """Get Serper API key from env var or config file."""
-    if os.environ.get("SERPER_API_KEY"):
-        return os.environ["SERPER_API_KEY"]
+    """Get Serper API key from env var or config file (looked up once)."""
+    api_key = os.environ.get("SERPER_API_KEY")
+    if api_key:
+        return api_key
 
     config = load_config()
     return config.get("serper_api_key", "")
 
 
+@functools.lru_cache(maxsize=32)
 def _parse_locale(locale: Optional[str]) -> tuple[str, str]:
     """Parse locale string into (gl, hl) for Serper."""
     if not locale:
@@ -49,114 +124,385 @@ def _parse_locale(locale: Optional[str]) -> tuple[str, str]:
     return gl, lang
 
 
+def _organic_to_result(item: dict, position: int) -> dict:
+    """Convert a Serper organic hit into an fcrawl search result."""
+    result_item = {
+        "title": item.get("title", ""),
+        "url": item["link"],
+        "description": item.get("snippet", ""),
+        "position": position,
+        "engines": _GOOGLE_ENGINES,
+    }
+    if item.get("date"):
+        result_item["date"] = item["date"]
+    if item.get("sitelinks"):
+        result_item["sitelinks"] = item["sitelinks"]
+    return result_item
+
+
+def _collect_organic(
+    organic: list[dict], results: list[dict], seen_urls: set[str], limit: int
+) -> int:
+    """Append unseen organic hits to results (up to limit); return how many."""
+    room = limit - len(results)
+    accepted: list[dict] = []
+    for item in organic:
+        url = item.get("link", "")
+        if not url:
+            continue
+        # One set probe: add() and see whether the set grew. The URL strings
+        # are kept in the results anyway and cache their own hash, so
+        # storing them costs only the set slot.
+        seen_before = len(seen_urls)
+        seen_urls.add(url)
+        if len(seen_urls) == seen_before:
+            continue
+        accepted.append(item)
+        if len(accepted) >= room:
+            break
+
+    results.extend(
+        _organic_to_result(item, position)
+        for position, item in enumerate(accepted, start=len(results) + 1)
+    )
+    return len(accepted)
+
+
+def _merge_pages(
+    pages: Iterator[tuple[int, Future]],
+    results: list[dict],
+    seen_urls: set[str],
+    limit: int,
+    extras: dict,
+) -> tuple[bool, Optional[str]]:
+    """Merge page responses in page order.
+
+    Returns (exhausted, error); exhausted is True once Serper runs out of new
+    results.
+    """
+    for page_number, future in pages:
+        status_code, body = future.result()
+        if body is None:
+            return False, "API error: oversized response"
+        if status_code != 200:
+            text = body[:120].decode(errors="replace")
+            return False, f"API error: {status_code} - {text}"
+
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return False, "API error: invalid JSON response"
+
+        if page_number == 1:
+            if data.get("knowledgeGraph"):
+                extras["knowledgeGraph"] = data["knowledgeGraph"]
+            if data.get("peopleAlsoAsk"):
+                extras["peopleAlsoAsk"] = data["peopleAlsoAsk"]
+            if data.get("relatedSearches"):
+                extras["relatedSearches"] = data["relatedSearches"]
+
+        organic = data.get("organic", [])
+        if not organic or not _collect_organic(organic, results, seen_urls, limit):
+            return True, None
+        if len(results) >= limit:
+            break
+    return False, None
+
+
 def _serper_search(
     query: str,
     limit: int,
-    locale: Optional[str],
+    gl: str,
+    hl: str,
     location: Optional[str],
     api_key: str,
-) -> tuple[list[dict], float, Optional[str], int, str, str, dict]:
+    prefetch: bool = True,
+) -> tuple[list[dict], float, Optional[str], int, dict]:
     """Search using Serper with pagination and deduplication.
 
-    Returns (results, elapsed, error, pages, gl, hl, extras).
+    Pages are fetched concurrently over one keep-alive session and merged in
+    page order as they arrive. With prefetch, every page the limit calls for
+    is requested up front so later pages download while earlier ones are
+    parsed; otherwise page 1 is fetched alone first to learn whether more
+    results exist. Pages not yet started when paging stops are cancelled.
+
+    gl and hl come from _parse_locale, already resolved by the caller for
+    the cache key.
+
+    Returns (results, elapsed, error, pages, extras).
     extras contains knowledgeGraph, peopleAlsoAsk, relatedSearches from page 1.
     """
-    gl, hl = _parse_locale(locale)
-    headers = {
-        "X-API-KEY": api_key,
-        "Content-Type": "application/json",
-    }
+    session = _get_session()
+    session.headers["X-API-KEY"] = api_key
+    # Serper pages are offsets of `num` results, so every page must ask for
+    # the same size for page N to start where page N-1 ended.
+    page_size = min(SERPER_MAX_RESULTS_PER_PAGE, limit)
 
     start = time.time()
     results: list[dict] = []
     seen_urls: set[str] = set()
-    requests_made = 0
+    issued: list[int] = []
     page = 1
+    batch = -(-limit // page_size) if prefetch else 1
     extras: dict = {}
 
+    def fetch(page_number: int) -> tuple[int, Optional[bytes]]:
+        """POST one page; return (status, body), body None if oversized."""
+        issued.append(page_number)
+        payload = {
+            "q": query,
+            "gl": gl,
+            "hl": hl,
+            "num": page_size,
+            "page": page_number,
+        }
+        if location:
+            payload["location"] = location
+        with session.post(
+            SERPER_ENDPOINT, json=payload, timeout=30, stream=True
+        ) as response:
+            # Read the body in chunks and give up past the ceiling rather
+            # than buffering whatever the endpoint sends.
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(64 * 1024):
+                size += len(chunk)
+                if size > SERPER_MAX_RESPONSE_BYTES:
+                    return response.status_code, None
+                chunks.append(chunk)
+            return response.status_code, b"".join(chunks)
+
     try:
         while len(results) < limit:
-            batch_size = min(SERPER_MAX_RESULTS_PER_PAGE, limit - len(results))
-            payload = {
-                "q": query,
-                "gl": gl,
-                "hl": hl,
-                "num": batch_size,
-                "page": page,
-            }
-            if location:
-                payload["location"] = location
-
-            response = requests.post(
-                SERPER_ENDPOINT,
-                headers=headers,
-                json=payload,
-                timeout=30,
+            pages = range(page, page + batch)
+            pool = ThreadPoolExecutor(
+                max_workers=min(batch, SERPER_MAX_CONCURRENT_PAGES)
             )
-            requests_made += 1
-
-            if response.status_code != 200:
-                elapsed = time.time() - start
-                return (
-                    [],
-                    elapsed,
-                    f"API error: {response.status_code} - {response.text[:120]}",
-                    requests_made,
-                    gl,
-                    hl,
-                    {},
+            futures = [pool.submit(fetch, page_number) for page_number in pages]
+            try:
+                exhausted, error = _merge_pages(
+                    zip(pages, futures), results, seen_urls, limit, extras
                 )
+            finally:
+                pool.shutdown(cancel_futures=True)
 
-            data = response.json()
-
-            if page == 1:
-                if data.get("knowledgeGraph"):
-                    extras["knowledgeGraph"] = data["knowledgeGraph"]
-                if data.get("peopleAlsoAsk"):
-                    extras["peopleAlsoAsk"] = data["peopleAlsoAsk"]
-                if data.get("relatedSearches"):
-                    extras["relatedSearches"] = data["relatedSearches"]
-
-            organic = data.get("organic", [])
-            if not organic:
-                break
+            if error:
+                elapsed = time.time() - start
+                return [], elapsed, error, len(issued), {}
 
-            page_added = 0
-            for item in organic:
-                url = item.get("link", "")
-                if not url or url in seen_urls:
-                    continue
-
-                seen_urls.add(url)
-                result_item = {
-                    "title": item.get("title", ""),
-                    "url": url,
-                    "description": item.get("snippet", ""),
-                    "position": len(results) + 1,
-                    "engines": ["google"],
-                }
-                if item.get("date"):
-                    result_item["date"] = item["date"]
-                if item.get("sitelinks"):
-                    result_item["sitelinks"] = item["sitelinks"]
-
-                results.append(result_item)
-                page_added += 1
-
-                if len(results) >= limit:
-                    break
-
-            if page_added == 0:
+            if exhausted:
                 break
 
-            page += 1
+            # Duplicates can leave the batch short; ask for what is missing
+            page += batch
+            batch = -(-(limit - len(results)) // page_size)
 
         elapsed = time.time() - start
-        return results[:limit], elapsed, None, requests_made, gl, hl, extras
+        return results[:limit], elapsed, None, len(issued), extras
 
     except requests.RequestException as e:
         elapsed = time.time() - start
-        return [], elapsed, f"Request failed: {str(e)}", requests_made, gl, hl, {}
+        return [], elapsed, f"Request failed: {str(e)}", len(issued), {}
+
+
+def _still_fresh(
+    query: str,
+    cached: CachedSearch,
+    limit: int,
+    location: Optional[str],
+    api_key: str,
+) -> bool:
+    """Check a stale cache entry against Serper's current top results.
+
+    The entry is kept if a small probe search returns the same top URLs in
+    the same order. A probe costs about as much as a search of its own size,
+    so searches no larger than the probe are simply refetched.
+    """
+    if limit <= SERPER_PROBE_SIZE:
+        return False
+    probe, _, error, _, _ = _serper_search(
+        query=query,
+        limit=SERPER_PROBE_SIZE,
+        gl=cached.gl,
+        hl=cached.hl,
+        location=location,
+        api_key=api_key,
+        prefetch=False,
+    )
+    if error or not probe:
+        return False
+    cached_top = [item.get("url") for item in cached.results[: len(probe)]]
+    return [item["url"] for item in probe] == cached_top
+
+
+def _require_api_key() -> str:
+    """Return the Serper API key, or explain how to set one and abort."""
+    api_key = _get_serper_api_key()
+    if not api_key:
+        console.print("[red]SERPER_API_KEY environment variable not set.[/red]")
+        console.print("Get your API key at: [cyan]https://serper.dev[/cyan]")
+        console.print("Then: [cyan]export SERPER_API_KEY='your_key'[/cyan]")
+        raise click.Abort()
+    return api_key
+
+
+def _search_cache_key(
+    query: str, limit: int, gl: str, hl: str, location: Optional[str]
+) -> str:
+    """Cache key for one search and its options."""
+    cache_opts = {
+        "engine": "serper",
+        "limit": limit,
+        "gl": gl,
+        "hl": hl,
+        "location": location,
+    }
+    return cache_key(query, cache_opts)
+
+
+def _read_search_cache(
+    query: str,
+    key: str,
+    limit: int,
+    location: Optional[str],
+    max_age: Optional[int],
+    cache_only: bool,
+) -> tuple[Optional[CachedSearch], bool]:
+    """Look up a cached search, revalidating it when older than max_age.
+
+    Returns (entry, revalidated); entry is None on a miss or when the stale
+    entry no longer matches Google.
+    """
+    data = read_cache("search", key)
+    if not data:
+        return None, False
+    cached = CachedSearch.from_dict(data)
+    stale = (
+        max_age is not None
+        and not cache_only
+        and time.time() - cached.fetched_at > max_age
+    )
+    if not stale:
+        return cached, False
+
+    # Rankings drift on their own schedule; keep the entry only while the
+    # top of the results page is unchanged.
+    if not _still_fresh(query, cached, limit, location, _require_api_key()):
+        return None, False
+    cached.fetched_at = time.time()
+    write_cache("search", key, asdict(cached))
+    return cached, True
+
+
+def _cache_results(
+    key: str,
+    gl: str,
+    hl: str,
+    location: Optional[str],
+    results: list[dict],
+    elapsed: float,
+    pages: int,
+    extras: dict,
+) -> CachedSearch:
+    """Store a fresh Serper search in the cache and return the entry."""
+    cached = CachedSearch(
+        results=results,
+        elapsed=elapsed,
+        gl=gl,
+        hl=hl,
+        pages=pages,
+        location=location,
+        extras=extras,
+        fetched_at=time.time(),
+    )
+    write_cache("search", key, asdict(cached))
+    return cached
+
+
+def _output_record(
+    query: str, cached: CachedSearch, location: Optional[str], from_cache: bool
+) -> dict:
+    """JSON output for one search."""
+    output_data = {
+        "query": query,
+        "engine": "serper",
+        "results": cached.results,
+        "meta": {
+            "gl": cached.gl,
+            "hl": cached.hl,
+            "pages": cached.pages,
+            "location": location,
+            "from_cache": from_cache,
+        },
+    }
+    if cached.extras:
+        output_data["extras"] = cached.extras
+    return output_data
+
+
+def _search_record(
+    query: str,
+    limit: int,
+    gl: str,
+    hl: str,
+    location: Optional[str],
+    no_cache: bool,
+    cache_only: bool,
+    max_age: Optional[int],
+    prefetch: bool,
+) -> dict:
+    """Run one query of a bulk search; errors are reported in the record."""
+    key = _search_cache_key(query, limit, gl, hl, location)
+    if not no_cache:
+        cached, _ = _read_search_cache(
+            query, key, limit, location, max_age, cache_only
+        )
+        if cached is not None:
+            return _output_record(query, cached, location, True)
+    if cache_only:
+        return {"query": query, "error": "Not in cache"}
+
+    results, elapsed, error, pages, extras = _serper_search(
+        query=query,
+        limit=limit,
+        gl=gl,
+        hl=hl,
+        location=location,
+        api_key=_get_serper_api_key(),
+        prefetch=prefetch,
+    )
+    if error:
+        return {"query": query, "error": error}
+    cached = _cache_results(key, gl, hl, location, results, elapsed, pages, extras)
+    return _output_record(query, cached, location, False)
+
+
+def _bulk_search(queries: list[str], output: Optional[str], **options):
+    """Search many queries concurrently, writing one JSON line per query.
+
+    Lines come out in input order as soon as each query (and every query
+    before it) has finished, so pipelines can consume them as they arrive.
+    """
+    if not options["cache_only"]:
+        _require_api_key()
+
+    # Bytes straight from orjson: always UTF-8, whatever the locale encoding
+    if output:
+        sink = open(output, "wb")
+    else:
+        sys.stdout.flush()
+        sink = sys.stdout.buffer
+    try:
+        search_one = functools.partial(_search_record, **options)
+        with ThreadPoolExecutor(max_workers=SERPER_MAX_CONCURRENT_QUERIES) as pool:
+            for record in pool.map(search_one, queries):
+                sink.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                sink.flush()
+    finally:
+        if output:
+            sink.close()
+    if output:
+        console.print(f"[green]✓ Saved to {output}[/green]")
 
 
 def _display_debug_info(
@@ -169,6 +515,8 @@ def _display_debug_info(
     location: Optional[str],
 ):
     """Display debug information about Serper request handling."""
+    from rich.table import Table
+
     console.print("\n[bold cyan]Search Debug:[/bold cyan]")
 
     table = Table(show_header=True, header_style="bold")
@@ -190,20 +538,21 @@ def _display_debug_info(
 def _display_results(results: list[dict]):
     """Display search results in pretty mode."""
     console.print("\n[bold]Search Results[/bold]", justify="center")
-    console.print("=" * 60)
 
+    # One markup string for the whole listing: a single Rich render instead
+    # of four per result. Result text is escaped so brackets print verbatim.
+    blocks = [_DIVIDER]
     for item in results:
-        title = item.get("title", "No title")
-        url = item.get("url", "")
+        block = (
+            f"[bold cyan]## {escape(item.get('title', 'No title'))}[/bold cyan]\n"
+            f"[blue]{escape(item.get('url', ''))}[/blue]\n"
+        )
         description = item.get("description", "")
-
-        console.print(f"[bold cyan]## {title}[/bold cyan]")
-        console.print(f"[blue]{url}[/blue]")
         if description:
-            console.print(description)
-        console.print()
-
-    console.print("=" * 60)
+            block += f"{escape(description)}\n"
+        blocks.append(block)
+    blocks.append(_DIVIDER)
+    console.print("\n".join(blocks))
 
 
 @click.command()
@@ -233,8 +582,19 @@ def _display_results(results: list[dict]):
 @click.option(
     "--cache-only", "cache_only", is_flag=True, help="Only read from cache, no search"
 )
+@click.option(
+    "--max-age",
+    type=int,
+    default=None,
+    help="Recheck cached results older than this many seconds against Google",
+)
 @click.option("--debug", is_flag=True, help="Show search provider stats")
 @click.option("--urls-only", is_flag=True, help="Only output URLs (no titles or snippets)")
+@click.option(
+    "--prefetch/--no-prefetch",
+    default=True,
+    help="Request all pages up front when --limit spans several (default: on)",
+)
 def search(
     query: str,
     limit: int,
@@ -245,31 +605,64 @@ def search(
     pretty: Optional[bool],
     no_cache: bool,
     cache_only: bool,
+    max_age: Optional[int],
     debug: bool,
     urls_only: bool,
+    prefetch: bool,
 ):
-    """Search the web using Serper.dev (Google API)."""
+    """Search the web using Serper.dev (Google API).
+
+    Pass "-" as QUERY to read one query per line from stdin; results are
+    written as JSON lines (one object per query) to stdout or --output.
+    JSON is implied there, and --pretty, --urls-only and --debug are rejected.
+    """
+    if query == "-":
+        for hint, given in (
+            ("--pretty/--no-pretty", pretty is not None),
+            ("--urls-only", urls_only),
+            ("--debug", debug),
+        ):
+            if given:
+                raise click.BadParameter(
+                    "not supported when reading queries from stdin", param_hint=hint
+                )
+
     pretty = resolve_pretty(pretty)
 
     if limit < 1:
         raise click.BadParameter("limit must be >= 1", param_hint="--limit")
+    if max_age is not None and max_age < 0:
+        raise click.BadParameter("max-age must be >= 0", param_hint="--max-age")
 
     gl, hl = _parse_locale(locale)
-    cache_opts = {
-        "engine": "serper",
-        "limit": limit,
-        "gl": gl,
-        "hl": hl,
-        "location": location,
-    }
-    key = cache_key(query, cache_opts)
 
-    cached_data = None
+    if query == "-":
+        queries = [line.strip() for line in sys.stdin]
+        _bulk_search(
+            [q for q in queries if q],
+            output=output,
+            limit=limit,
+            gl=gl,
+            hl=hl,
+            location=location,
+            no_cache=no_cache,
+            cache_only=cache_only,
+            max_age=max_age,
+            prefetch=prefetch,
+        )
+        return
+
+    key = _search_cache_key(query, limit, gl, hl, location)
+
+    cached: Optional[CachedSearch] = None
     from_cache = False
     if not no_cache:
-        cached = read_cache("search", key)
-        if cached:
-            cached_data = cached
+        cached, revalidated = _read_search_cache(
+            query, key, limit, location, max_age, cache_only
+        )
+        if revalidated:
+            console.print("[dim]Cached result still current[/dim]")
+        if cached is not None:
             from_cache = True
             console.print("[dim]Using cached result[/dim]")
 
@@ -278,50 +671,43 @@ def search(
         raise click.Abort()
 
     if not from_cache:
-        api_key = _get_serper_api_key()
-        if not api_key:
-            console.print("[red]SERPER_API_KEY environment variable not set.[/red]")
-            console.print("Get your API key at: [cyan]https://serper.dev[/cyan]")
-            console.print("Then: [cyan]export SERPER_API_KEY='your_key'[/cyan]")
-            raise click.Abort()
+        api_key = _require_api_key()
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(f"Searching '{query}'...", total=None)
-            results, elapsed, error, pages, gl, hl, extras = _serper_search(
-                query=query,
-                limit=limit,
-                locale=locale,
-                location=location,
-                api_key=api_key,
-            )
+        run_search = functools.partial(
+            _serper_search,
+            query=query,
+            limit=limit,
+            gl=gl,
+            hl=hl,
+            location=location,
+            api_key=api_key,
+            prefetch=prefetch,
+        )
+        if limit > SERPER_MAX_RESULTS_PER_PAGE:
+            # Multi-page searches take long enough to be worth a spinner;
+            # everything else skips the import and the refresh thread.
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                refresh_per_second=4,
+                transient=True,
+            ) as progress:
+                progress.add_task(f"Searching '{query}'...", total=None)
+                results, elapsed, error, pages, extras = run_search()
+        else:
+            console.print(f"[dim]Searching '{escape(query)}'...[/dim]")
+            results, elapsed, error, pages, extras = run_search()
 
         if error:
             console.print(f"[red]Error: {error}[/red]")
             raise click.Abort()
 
-        cached_data = {
-            "results": results,
-            "elapsed": elapsed,
-            "engine": "serper",
-            "gl": gl,
-            "hl": hl,
-            "pages": pages,
-            "location": location,
-            "extras": extras,
-        }
-        write_cache("search", key, cached_data)
+        cached = _cache_results(key, gl, hl, location, results, elapsed, pages, extras)
 
-    cache_data = cached_data or {}
-    results = cache_data.get("results", [])
-    extras = cache_data.get("extras", {})
-    elapsed = float(cache_data.get("elapsed", 0.0))
-    pages = int(cache_data.get("pages", 0))
-    gl = str(cache_data.get("gl", gl))
-    hl = str(cache_data.get("hl", hl))
+    results = cached.results
 
     if not results:
         console.print("[yellow]No results found[/yellow]")
@@ -332,10 +718,10 @@ def search(
     if debug:
         _display_debug_info(
             result_count=len(results),
-            elapsed=elapsed,
-            gl=gl,
-            hl=hl,
-            pages=pages,
+            elapsed=cached.elapsed,
+            gl=cached.gl,
+            hl=cached.hl,
+            pages=cached.pages,
             from_cache=from_cache,
             location=location,
         )
@@ -344,38 +730,31 @@ def search(
         _display_results(results)
 
     if output or json_output:
-        output_data = {
-            "query": query,
-            "engine": "serper",
-            "results": results,
-            "meta": {
-                "gl": gl,
-                "hl": hl,
-                "pages": pages,
-                "location": location,
-                "from_cache": from_cache,
-            },
-        }
-        if extras:
-            output_data["extras"] = extras
-        handle_output(
-            output_data,
-            output_file=output,
-            json_output=True,
-            pretty=pretty,
-            format_type="json",
-        )
+        output_data = _output_record(query, cached, location, from_cache)
+        if not output and not sys.stdout.isatty():
+            # Piped JSON: encoded bytes go straight to stdout
+            emit_json(output_data, pretty)
+        else:
+            handle_output(
+                output_data,
+                output_file=output,
+                json_output=True,
+                pretty=pretty,
+                format_type="json",
+            )
     elif not pretty:
+        # Build the whole listing and write it once
         if urls_only:
-            for item in results:
-                print(item.get("url", ""))
+            lines = [item.get("url", "") for item in results]
         else:
+            lines = []
             for item in results:
-                url = item.get("url", "")
+                lines.append(item.get("url", ""))
                 title = item.get("title", "")
                 desc = item.get("description", "")
-                print(url)
                 if title:
-                    print(f"  {title}")
+                    lines.append(f"  {title}")
                 if desc:
-                    print(f"  {desc}")
+                    lines.append(f"  {desc}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
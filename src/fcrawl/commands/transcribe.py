@@ -8,88 +8,91 @@ Usage:
     fcrawl transcribe podcast.mp3 -m paraformer --simplified
 """
 
-import json
+import re
 import sys
+from itertools import accumulate, chain, count
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import click
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..utils.output import handle_output, console
+from ..utils.output import dump_json, handle_output, console
+
+# Sentence boundaries (CJK and Latin terminators) used to cut subtitle cues
+_SENTENCE_SPLIT = re.compile(r'(?<=[。！？.!?])\s*')
+
+# Bounds (seconds) on how long a single subtitle cue stays on screen
+_MIN_CUE_SECONDS = 1.0
+_MAX_CUE_SECONDS = 10.0
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
     return f"{minutes}:{secs:02d}"
 
 
-def format_as_srt(text: str, duration: float) -> str:
-    """
-    Format transcript as SRT subtitle format.
-    Simple implementation - creates segments by splitting on sentence boundaries.
-    """
-    import re
+def _format_srt_time(t: float, sep: str = ",") -> str:
+    """Format seconds as a subtitle timestamp (HH:MM:SS,mmm; sep="." for VTT)."""
+    whole = int(t)
+    m, s = divmod(whole, 60)
+    h, m = divmod(m, 60)
+    ms = int((t - whole) * 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
 
-    # Split on sentence boundaries
-    sentences = re.split(r'(?<=[。！？.!?])\s*', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
 
-    if not sentences:
-        return ""
+def _iter_segments(
+    text: str, duration: float
+) -> Iterator[tuple[int, float, float, str]]:
+    """Yield (index, start, end, sentence) cues, one per sentence of text."""
+    # Split on sentence boundaries, stripping each piece once
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT.split(text)) if s]
+
+    n = len(sentences)
+    if n == 0:
+        return
 
     # Distribute duration across sentences (rough approximation)
-    avg_duration = duration / len(sentences) if sentences else duration
+    avg_duration = duration / n
 
-    srt_lines = []
-    current_time = 0.0
+    # Vary duration by sentence length; cues run back to back, so end times
+    # are the running total and each cue starts where the previous ended
+    durations = [
+        max(min(avg_duration * (len(s) / 20), _MAX_CUE_SECONDS), _MIN_CUE_SECONDS)
+        for s in sentences
+    ]
+    end_times = list(accumulate(durations))
+    start_times = chain((0.0,), end_times)
 
-    for i, sentence in enumerate(sentences, 1):
-        start_time = current_time
-        # Vary duration by sentence length
-        sentence_duration = min(avg_duration * (len(sentence) / 20), 10.0)
-        sentence_duration = max(sentence_duration, 1.0)
-        end_time = start_time + sentence_duration
-        current_time = end_time
+    yield from zip(count(1), start_times, end_times, sentences)
 
-        # Format timestamps
-        def format_srt_time(t):
-            h = int(t // 3600)
-            m = int((t % 3600) // 60)
-            s = int(t % 60)
-            ms = int((t % 1) * 1000)
-            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
-        srt_lines.append(str(i))
-        srt_lines.append(f"{format_srt_time(start_time)} --> {format_srt_time(end_time)}")
-        srt_lines.append(sentence)
-        srt_lines.append("")
+def _format_cues(text: str, duration: float, sep: str) -> str:
+    """Render subtitle cues with the given millisecond separator."""
+    lines = []
+    for i, start_time, end_time, sentence in _iter_segments(text, duration):
+        start = _format_srt_time(start_time, sep)
+        end = _format_srt_time(end_time, sep)
+        lines.extend((str(i), f"{start} --> {end}", sentence, ""))
+    return "\n".join(lines)
 
-    return "\n".join(srt_lines)
+
+def format_as_srt(text: str, duration: float) -> str:
+    """
+    Format transcript as SRT subtitle format.
+    Simple implementation - creates segments by splitting on sentence boundaries.
+    """
+    return _format_cues(text, duration, ",")
 
 
 def format_as_vtt(text: str, duration: float) -> str:
     """
     Format transcript as WebVTT subtitle format.
     """
-    srt = format_as_srt(text, duration)
-    if not srt:
-        return "WEBVTT\n\n"
-
-    # Convert SRT to VTT
-    vtt_lines = ["WEBVTT", ""]
-    for line in srt.split("\n"):
-        # Replace comma with dot in timestamps
-        if " --> " in line:
-            line = line.replace(",", ".")
-        vtt_lines.append(line)
-
-    return "\n".join(vtt_lines)
+    return "WEBVTT\n\n" + _format_cues(text, duration, ".")
 
 
 @click.command('transcribe')
@@ -150,10 +153,14 @@ def transcribe(
 
     # Transcribe with progress indicator
     if show_progress:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             progress.add_task(f"Transcribing {file_path.name}...", total=None)
             result = transcriber.transcribe_file(
@@ -174,7 +181,7 @@ def transcribe(
     # Handle errors
     if result.error:
         if json_output:
-            print(json.dumps({"error": result.error}, indent=2))
+            print(dump_json({"error": result.error}).decode())
         else:
             console.print(f"[red]Error: {result.error}[/red]")
         raise click.Abort()
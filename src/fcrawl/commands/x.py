@@ -1,21 +1,33 @@
 """X/Twitter commands for fcrawl"""
 
 import asyncio
-import json
+import operator
 import re
-from contextlib import aclosing
-from typing import Optional
+import sys
+from collections import deque
+from contextlib import aclosing, suppress
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Optional
 
 import click
+import orjson
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.markup import escape
 
 from ..utils.article_parser import parse_article_from_response
-from ..utils.output import handle_output, save_to_file
-from ..utils.x_client import get_x_api, get_x_db_path, get_x_pool
+from ..utils.output import (
+    dump_json,
+    emit_json,
+    emit_json_stream,
+    handle_output,
+    save_to_file,
+)
+from ..utils.x_client import get_x_api, get_x_db_path, get_x_pool, run_x
 from ..vendors.twscrape import NoAccountError, Tweet, User
-from ..vendors.twscrape.models import parse_tweet
+from ..vendors.twscrape.models import parse_tweet, parse_tweets
+from ..vendors.twscrape.utils import utc
 from ._x_diagnose import render_diagnostics, run_diagnostics
 from . import _x_twitterapi as twitterapi_backend
 
@@ -27,6 +39,31 @@ console = Console()
 PROVIDER_CHOICES = ['twscrape', 'twitterapi']
 PROVIDER_DEFAULT = 'twscrape'
 
+_DIVIDER = "=" * 60
+_RULE = "─" * 60
+
+_STATUS_RE = re.compile(r'/status/(\d+)')
+_ARTICLE_RE = re.compile(r'/i/article/(\d+)')
+_LEADING_MENTION_RE = re.compile(r'\s*@(\w+)')
+_BITRATE = operator.attrgetter("bitrate")
+
+
+def _progress():
+    """Return the spinner shown while a command waits on the network.
+
+    rich.progress is imported here rather than at module load so that
+    commands which never show a spinner don't pay for it.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+        transient=True,
+    )
+
 
 def _format_unlock(dt) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S") if dt else "unknown"
@@ -64,23 +101,188 @@ def _handle_no_account_error(e: NoAccountError) -> None:
 
 def extract_tweet_id(id_or_url: str) -> int:
     """Extract tweet ID from URL or return the ID directly."""
+    # Bare IDs are the common case and need no pattern scan
+    if id_or_url.isdecimal():
+        return int(id_or_url)
     # Handle URLs like https://x.com/user/status/123456789 or https://twitter.com/user/status/123456789
-    match = re.search(r'/status/(\d+)', id_or_url)
+    match = _STATUS_RE.search(id_or_url)
     if match:
         return int(match.group(1))
     # Assume it's a direct ID
     return int(id_or_url)
 
 
+def _iter_json(data: Any, indent: bytes = b"", depth: int = 2) -> Iterator[bytes]:
+    """Yield dump_json(data) chunk by chunk, serializing Tweet/User on the way.
+
+    The outer depth levels of lists/dicts are walked member by member, so a
+    large result list never sits in memory as one encoded buffer.
+    """
+    if not (depth and data and isinstance(data, (list, dict))):
+        yield dump_json(data, default=_x_default).replace(b"\n", b"\n" + indent)
+        return
+    inner = indent + b"  "
+    is_dict = isinstance(data, dict)
+    members = data.items() if is_dict else enumerate(data)
+    for idx, (key, value) in enumerate(members):
+        yield (b",\n" if idx else b"{\n" if is_dict else b"[\n") + inner
+        if is_dict:
+            yield dump_json(key) + b": "
+        yield from _iter_json(value, inner, depth - 1)
+    yield b"\n" + indent + (b"}" if is_dict else b"]")
+
+
+def _save_json_stream(data: Any, path: str):
+    """Save data as indented JSON, writing it out as it is encoded."""
+    save_to_file(_iter_json(data), path, 'json')
+
+
+async def _stream_json(gen, limit: int, path: str) -> int:
+    """Write up to limit items from a twscrape generator to path as a JSON array.
+
+    Each tweet is encoded and written as it arrives, so the file fills while
+    later pages are still being fetched and no result list is kept. Writes go
+    to a ``.part`` file that replaces path only once the array is complete;
+    if fetching fails midway it is removed and path is left untouched. Nothing
+    is created when there is nothing to write. Returns the item count.
+    """
+    target = Path(path)
+    part = target.with_name(target.name + ".part")
+    count = 0
+    f = None
+    try:
+        async with aclosing(_prefetch(gen)) as items:
+            async for item in items:
+                if f is None:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    f = open(part, "wb")
+                f.write(b",\n  " if count else b"[\n  ")
+                for chunk in _iter_json(item, b"  ", 0):
+                    f.write(chunk)
+                count += 1
+                if count >= limit:
+                    break
+        if f is not None:
+            f.write(b"\n]")
+            f.close()
+            part.replace(target)
+    except BaseException:
+        if f is not None:
+            f.close()
+            part.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _print_json_or_save(data: Any, output: Optional[str], json_output: bool):
+    """Save JSON to output if given, otherwise print it when --json is set."""
+    if output:
+        _save_json_stream(data, output)
+    elif json_output and sys.stdout.isatty():
+        emit_json(data, default=_x_default)
+    elif json_output:
+        # Piped: encode and write one tweet at a time, like the file path
+        emit_json_stream(_iter_json(data))
+
+
+_PREFETCH_DONE = object()
+
+
+async def _prefetch(gen, depth: int = 2):
+    """Iterate an async generator while a worker task stays up to depth items ahead.
+
+    The worker starts the next page request as soon as the consumer has taken
+    all but the last few items of the current one, overlapping the network
+    round trip with whatever the caller does per item. Exceptions from the
+    source generator are re-raised in the consumer; closing the prefetcher
+    cancels the worker and closes the source.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def worker():
+        try:
+            async with aclosing(gen):
+                async for item in gen:
+                    await queue.put((item, None))
+        except Exception as e:
+            await queue.put((_PREFETCH_DONE, e))
+        else:
+            await queue.put((_PREFETCH_DONE, None))
+
+    task = asyncio.create_task(worker())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _collect(gen, limit: int) -> list:
+    """Gather up to limit items from a twscrape generator, prefetching pages."""
+    out: list = []
+    add = out.append
+    count = 0
+    async with aclosing(_prefetch(gen)) as items:
+        async for item in items:
+            add(item)
+            count += 1
+            if count >= limit:
+                break
+    return out
+
+
+async def _account_slots(api, *queues: str) -> int:
+    """Return how many requests on queues can be in flight at once.
+
+    twscrape locks an account per queue for the length of each request, and
+    a request that finds no free account raises NoAccountError instead of
+    waiting. Concurrency is therefore capped at the active accounts with no
+    lock on any of queues (at least 1, so an exhausted pool still reports why).
+    """
+    now = utc.now()
+    free = 0
+    for acc in await api.pool.get_all():
+        if acc.active and not any(
+            (until := acc.locks.get(q)) and until > now for q in queues
+        ):
+            free += 1
+    return max(free, 1)
+
+
+async def _fetch_batch(api, handles: list[str], limit: int, concurrency: int) -> list:
+    """Fetch (user, tweets) for each handle, at most concurrency at a time.
+
+    The limit is lowered to the number of free accounts (see _account_slots)
+    so a small pool runs the handles in turn rather than aborting.
+    """
+    slots = await _account_slots(api, "UserByScreenName", "UserTweets")
+    semaphore = asyncio.Semaphore(min(concurrency, slots))
+
+    async def _one(handle):
+        async with semaphore:
+            return await _fetch_user_tweets(api, handle, limit)
+
+    return await asyncio.gather(*(_one(h) for h in handles))
+
+
+@lru_cache(maxsize=4096)
 def format_number(n: int | None) -> str:
     """Format a number with commas for readability."""
     if n is None:
         return "0"
-    if n >= 1_000_000:
-        return f"{n / 1_000_000:.1f}M"
-    if n >= 1_000:
+    # Most engagement counts are small; test that case first.
+    if n < 1_000:
+        return f"{n:,}"
+    if n < 1_000_000:
         return f"{n / 1_000:.1f}K"
-    return f"{n:,}"
+    return f"{n / 1_000_000:.1f}M"
 
 
 def _media_summary(media) -> str | None:
@@ -97,45 +299,42 @@ def _media_summary(media) -> str | None:
     return ", ".join(bits) if bits else None
 
 
-def display_tweet(tweet: Tweet, indent: str = ""):
-    """Display a tweet in a formatted way.
-
-    Args:
-        tweet: The tweet to render.
-        indent: Prefix applied to every line. Used for nesting quoted tweets.
-    """
-    console.print(f"{indent}" + "=" * 60)
-    console.print(f"{indent}[bold cyan]@{tweet.user.username}[/bold cyan] ({tweet.user.displayname})")
-    console.print(f"{indent}[dim]Followers: {format_number(tweet.user.followersCount)} | {tweet.date.strftime('%Y-%m-%d %H:%M:%S')}[/dim]")
-    console.print(f"{indent}[blue]{tweet.url}[/blue]")
+def _tweet_lines(tweet: Tweet, indent: str, lines: list[str]) -> list[str]:
+    """Append the markup lines for one tweet (and any quoted tweet) to lines."""
+    lines.append(f"{indent}{_DIVIDER}")
+    lines.append(f"{indent}[bold cyan]@{tweet.user.username}[/bold cyan] ({escape(tweet.user.displayname)})")
+    lines.append(f"{indent}[dim]Followers: {format_number(tweet.user.followersCount)} | {tweet.date.isoformat(' ', 'seconds')[:19]}[/dim]")
+    lines.append(f"{indent}[blue]{tweet.url}[/blue]")
 
     # Reply context (when tweet is a reply to someone else)
     if tweet.inReplyToUser is not None:
-        console.print(f"{indent}[dim]↳ replying to @{tweet.inReplyToUser.username}[/dim]")
+        lines.append(f"{indent}[dim]↳ replying to @{tweet.inReplyToUser.username}[/dim]")
 
-    console.print()
-    # rawContent can be multiline; prefix each line with indent for clean nesting
+    lines.append("")
+    # rawContent can be multiline; prefix each line with indent for clean nesting.
+    # Escaped so brackets in the text can't open markup that spills into the
+    # lines rendered after it.
     for line in tweet.rawContent.splitlines() or [""]:
-        console.print(f"{indent}{line}")
+        lines.append(f"{indent}{escape(line)}")
 
     # Media summary
     media_line = _media_summary(tweet.media)
     if media_line:
-        console.print(f"{indent}[dim]📎 {media_line}[/dim]")
+        lines.append(f"{indent}[dim]📎 {media_line}[/dim]")
 
     # Quoted tweet (recursive, nested with extra indent)
     if tweet.quotedTweet is not None:
-        console.print()
-        console.print(f"{indent}[yellow]┌─ Quoting ─────[/yellow]")
-        display_tweet(tweet.quotedTweet, indent=indent + "[yellow]│[/yellow] ")
-        console.print(f"{indent}[yellow]└───────────────[/yellow]")
+        lines.append("")
+        lines.append(f"{indent}[yellow]┌─ Quoting ─────[/yellow]")
+        _tweet_lines(tweet.quotedTweet, indent + "[yellow]│[/yellow] ", lines)
+        lines.append(f"{indent}[yellow]└───────────────[/yellow]")
 
     # Retweet indicator (retweets wrap the full original; we already rendered the
     # outer tweet's metadata, so just point at the underlying original)
     if tweet.retweetedTweet is not None:
-        console.print(f"{indent}[green]🔁 Retweet of {tweet.retweetedTweet.url}[/green]")
+        lines.append(f"{indent}[green]🔁 Retweet of {tweet.retweetedTweet.url}[/green]")
 
-    console.print()
+    lines.append("")
 
     # Engagement stats
     stats = []
@@ -146,39 +345,64 @@ def display_tweet(tweet: Tweet, indent: str = ""):
         stats.append(f"[yellow]Quote[/yellow] {format_number(tweet.quoteCount)}")
     if tweet.viewCount:
         stats.append(f"[dim]Views[/dim] {format_number(tweet.viewCount)}")
-    console.print(f"{indent}" + "  ".join(stats))
+    lines.append(f"{indent}" + "  ".join(stats))
+    return lines
+
+
+def display_tweet(tweet: Tweet, indent: str = ""):
+    """Display a tweet in a formatted way.
+
+    Args:
+        tweet: The tweet to render.
+        indent: Prefix applied to every line. Used for nesting quoted tweets.
+    """
+    console.print("\n".join(_tweet_lines(tweet, indent, [])), highlight=False)
+
+
+def display_tweets(tweets: list[Tweet]):
+    """Display several tweets with a single console write."""
+    lines: list[str] = []
+    for tweet in tweets:
+        _tweet_lines(tweet, "", lines)
+    if lines:
+        console.print("\n".join(lines), highlight=False)
 
 
 def display_article(article):
     """Display article content in markdown format."""
-    console.print()
-    console.print("─" * 60)
-    console.print(f"[bold magenta]📄 Article: {article.title}[/bold magenta]")
-    console.print("─" * 60)
-    console.print()
-    console.print(article.to_markdown())
-    console.print()
+    lines = [
+        "",
+        _RULE,
+        f"[bold magenta]📄 Article: {escape(article.title)}[/bold magenta]",
+        _RULE,
+        "",
+        # Escaped like tweet text: brackets in the body (link text, stray
+        # tags) must not open markup that spills into the lines after it
+        escape(article.to_markdown()),
+        "",
+    ]
     if article.cover_image_url:
-        console.print(f"[dim]Cover image: {article.cover_image_url}[/dim]")
+        lines.append(f"[dim]Cover image: {article.cover_image_url}[/dim]")
+    console.print("\n".join(lines))
 
 
 def display_user(user: User):
     """Display a user profile in a formatted way."""
-    console.print("=" * 60)
-    console.print(f"[bold cyan]@{user.username}[/bold cyan] ({user.displayname})")
+    lines = [_DIVIDER, f"[bold cyan]@{user.username}[/bold cyan] ({escape(user.displayname)})"]
     if user.blue:
-        console.print("[blue]Verified[/blue]")
-    console.print(f"[blue]{user.url}[/blue]")
-    console.print()
+        lines.append("[blue]Verified[/blue]")
+    lines.append(f"[blue]{user.url}[/blue]")
+    lines.append("")
     if user.rawDescription:
-        console.print(user.rawDescription)
-        console.print()
+        lines.append(escape(user.rawDescription))
+        lines.append("")
     if user.location:
-        console.print(f"[dim]Location:[/dim] {user.location}")
-    console.print(f"[dim]Joined:[/dim] {user.created.strftime('%Y-%m-%d')}")
-    console.print()
-    console.print(f"[bold]Followers:[/bold] {format_number(user.followersCount)}  [bold]Following:[/bold] {format_number(user.friendsCount)}")
-    console.print(f"[bold]Tweets:[/bold] {format_number(user.statusesCount)}  [bold]Likes:[/bold] {format_number(user.favouritesCount)}")
+        lines.append(f"[dim]Location:[/dim] {escape(user.location)}")
+    lines.append(f"[dim]Joined:[/dim] {user.created.isoformat()[:10]}")
+    lines.append("")
+    lines.append(f"[bold]Followers:[/bold] {format_number(user.followersCount)}  [bold]Following:[/bold] {format_number(user.friendsCount)}")
+    lines.append(f"[bold]Tweets:[/bold] {format_number(user.statusesCount)}  [bold]Likes:[/bold] {format_number(user.favouritesCount)}")
+    console.print("\n".join(lines), highlight=False)
 
 
 def _media_to_dict(media) -> dict:
@@ -195,7 +419,7 @@ def _media_to_dict(media) -> dict:
             mp4_variants = [
                 var for var in v.variants if var.contentType == "video/mp4"
             ]
-            best = max(mp4_variants, key=lambda x: x.bitrate, default=None)
+            best = max(mp4_variants, key=_BITRATE, default=None)
             videos.append({
                 "thumbnail": v.thumbnailUrl,
                 "url": best.url if best else None,
@@ -216,15 +440,16 @@ def tweet_to_dict(tweet: Tweet) -> dict:
     Recursively serializes quotedTweet and retweetedTweet so the full
     relational structure of a tweet is preserved (quotes, replies, media).
     """
+    user = tweet.user
     d: dict = {
         "id": tweet.id,
         "url": tweet.url,
-        "date": tweet.date.isoformat(),
+        "date": tweet.date,
         "lang": tweet.lang,
         "user": {
-            "username": tweet.user.username,
-            "displayname": tweet.user.displayname,
-            "followersCount": tweet.user.followersCount,
+            "username": user.username,
+            "displayname": user.displayname,
+            "followersCount": user.followersCount,
         },
         "content": tweet.rawContent,
         "likeCount": tweet.likeCount,
@@ -240,17 +465,20 @@ def tweet_to_dict(tweet: Tweet) -> dict:
     if media:
         d["media"] = media
 
-    if tweet.inReplyToUser is not None:
+    reply_to = tweet.inReplyToUser
+    if reply_to is not None:
         d["inReplyTo"] = {
-            "username": tweet.inReplyToUser.username,
+            "username": reply_to.username,
             "tweetId": tweet.inReplyToTweetIdStr,
         }
 
-    if tweet.quotedTweet is not None:
-        d["quotedTweet"] = tweet_to_dict(tweet.quotedTweet)
+    quoted = tweet.quotedTweet
+    if quoted is not None:
+        d["quotedTweet"] = tweet_to_dict(quoted)
 
-    if tweet.retweetedTweet is not None:
-        d["retweetedTweet"] = tweet_to_dict(tweet.retweetedTweet)
+    retweeted = tweet.retweetedTweet
+    if retweeted is not None:
+        d["retweetedTweet"] = tweet_to_dict(retweeted)
 
     return d
 
@@ -264,7 +492,7 @@ def user_to_dict(user: User) -> dict:
         "url": user.url,
         "description": user.rawDescription,
         "location": user.location,
-        "created": user.created.isoformat(),
+        "created": user.created,
         "followersCount": user.followersCount,
         "friendsCount": user.friendsCount,
         "statusesCount": user.statusesCount,
@@ -274,6 +502,21 @@ def user_to_dict(user: User) -> dict:
     }
 
 
+def _x_default(obj: Any) -> Any:
+    """JSON hook that serializes Tweet/User objects while they are encoded.
+
+    orjson writes datetimes itself; the stdlib encoder behind Rich's
+    print_json needs them converted here, to the same ISO 8601 text.
+    """
+    if isinstance(obj, Tweet):
+        return tweet_to_dict(obj)
+    if isinstance(obj, User):
+        return user_to_dict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 @click.group()
 def x():
     """X/Twitter commands - search, fetch tweets, and manage accounts.
@@ -293,7 +536,7 @@ def x():
 def x_diagnose():
     """Run twscrape/X preflight checks and print a structured report."""
     try:
-        report = asyncio.run(run_diagnostics())
+        report = run_x(run_diagnostics())
     except Exception as e:
         console.print(f"[red]Error running diagnostics: {e}[/red]")
         raise click.Abort()
@@ -326,11 +569,7 @@ def x_search(query: str, limit: int, sort: str, provider: str, output: Optional[
     # backend does its own API-key check + error translation; sort option is
     # mapped inside fetch_search() so we don't need product mapping here.
     if provider == 'twitterapi':
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             progress.add_task(f"Searching for '{query}' (twitterapi.io)...", total=None)
             tweets = twitterapi_backend.fetch_search(query, limit=limit, sort=sort)
             progress.stop()
@@ -342,15 +581,11 @@ def x_search(query: str, limit: int, sort: str, provider: str, output: Optional[
         console.print(f"[green]Found {len(tweets)} tweets[/green]")
 
         if json_output or output:
-            data = [tweet_to_dict(t) for t in tweets]
-            if output:
-                save_to_file(json.dumps(data, indent=2), output, 'json')
-            if json_output and not output:
-                console.print_json(json.dumps(data, indent=2))
+            data = tweets
+            _print_json_or_save(data, output, json_output)
         else:
-            for tweet in tweets:
-                display_tweet(tweet)
-            console.print("=" * 60)
+            display_tweets(tweets)
+            console.print(_DIVIDER)
         return
 
     # twscrape backend (original path) -----------------------------------
@@ -365,23 +600,17 @@ def x_search(query: str, limit: int, sort: str, provider: str, output: Optional[
 
     async def _fetch():
         api = get_x_api()
-        results = []
-        async with aclosing(api.search(query, limit=limit, kv={'product': product})) as gen:
-            async for tweet in gen:
-                results.append(tweet)
-                if len(results) >= limit:
-                    break
-        return results
+        gen = api.search(query, limit=limit, kv={'product': product})
+        if output:
+            # Saved as pages arrive; -o shows nothing else, so keep no list
+            return await _stream_json(gen, limit, output)
+        return await _collect(gen, limit)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task(f"Searching for '{query}'...", total=None)
 
         try:
-            tweets = asyncio.run(_fetch())
+            result = run_x(_fetch())
             progress.stop()
         except NoAccountError as e:
             progress.stop()
@@ -392,22 +621,20 @@ def x_search(query: str, limit: int, sort: str, provider: str, output: Optional[
             console.print(f"[red]Error: {e}[/red]")
             raise click.Abort()
 
-    if not tweets:
+    found = result if output else len(result)
+    if not found:
         console.print("[yellow]No tweets found[/yellow]")
         return
 
-    console.print(f"[green]Found {len(tweets)} tweets[/green]")
+    console.print(f"[green]Found {found} tweets[/green]")
 
-    if json_output or output:
-        data = [tweet_to_dict(t) for t in tweets]
-        if output:
-            save_to_file(json.dumps(data, indent=2), output, 'json')
-        if json_output and not output:
-            console.print_json(json.dumps(data, indent=2))
+    if output:
+        console.print(f"[green]✓ Saved to {output}[/green]")
+    elif json_output:
+        _print_json_or_save(result, None, json_output)
     else:
-        for tweet in tweets:
-            display_tweet(tweet)
-        console.print("=" * 60)
+        display_tweets(result)
+        console.print(_DIVIDER)
 
 
 @x.command(name='tweet')
@@ -445,11 +672,7 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
             console.print("[yellow]--with-replies requires --thread flag[/yellow]")
             with_replies = False
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             desc = (
                 f"Fetching thread + replies {tweet_id} (twitterapi.io)..."
                 if with_replies
@@ -486,72 +709,84 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
         if json_output or output:
             if thread and with_replies:
                 data = {
-                    "thread": [tweet_to_dict(t) for t in tweets],
-                    "replies": [tweet_to_dict(t) for t in replies],
+                    "thread": tweets,
+                    "replies": replies,
                 }
             elif thread:
-                data = [tweet_to_dict(t) for t in tweets]
+                data = tweets
             else:
-                data = tweet_to_dict(tweets[0])
-            if output:
-                save_to_file(json.dumps(data, indent=2), output, 'json')
-            if json_output and not output:
-                console.print_json(json.dumps(data, indent=2))
+                data = tweets[0]
+            _print_json_or_save(data, output, json_output)
         else:
-            for t in tweets:
-                display_tweet(t)
+            display_tweets(tweets)
             if thread and len(tweets) > 1:
                 console.print(
                     f"\n[dim]Thread: {len(tweets)} tweets from @{tweets[0].user.username}[/dim]"
                 )
             if replies:
-                console.print("\n" + "─" * 60)
+                console.print("\n" + _RULE)
                 console.print(
                     f"[bold]Replies[/bold] [dim]({len(replies)} sorted by likes)[/dim]"
                 )
-                console.print("─" * 60)
-                for t in replies:
-                    display_tweet(t)
+                console.print(_RULE)
+                display_tweets(replies)
         return
 
     # twscrape backend (original path below) -----------------------------
 
-    async def _fetch():
-        api = get_x_api()
+    async def _fetch(api):
         # Use raw to get both tweet and article data
         rep = await api.tweet_details_raw(tweet_id)
         if not rep:
-            return None, None
-        response_json = rep.json()
-        tweet = parse_tweet(rep, tweet_id)
+            return None, None, []
+        # Decode once; twscrape's parsers accept the already-parsed dict
+        response_json = orjson.loads(rep.content)
+        tweet = parse_tweet(response_json, tweet_id)
         article = parse_article_from_response(response_json)
-        return tweet, article
+        # TweetDetail already carries the conversation around the focal tweet
+        # (ancestors and the author's follow-ups); keep it for thread assembly.
+        context = list(parse_tweets(response_json)) if thread else []
+        return tweet, article, context
 
     def _is_reply_to_others(tweet, author_username: str) -> bool:
         """Check if tweet is an @reply to someone other than self."""
-        content = tweet.rawContent.strip()
-        # If starts with @mention that isn't the author, it's a reply to others
-        if content.startswith('@'):
-            # Extract the first @mention
-            import re
-            match = re.match(r'@(\w+)', content)
-            if match:
-                mentioned = match.group(1).lower()
-                # If mentioning someone other than self, it's a reply to others
-                if mentioned != author_username.lower():
-                    return True
+        # If it starts with an @mention that isn't the author, it's a reply to
+        # others. Matching past leading whitespace avoids copying the body.
+        match = _LEADING_MENTION_RE.match(tweet.rawContent)
+        if match and match.group(1).lower() != author_username.lower():
+            return True
         return False
 
-    async def _fetch_thread(original_tweet, with_replies: bool = False, reply_limit: int = 30):
-        """Fetch full thread by walking the inReplyToTweetId chain + fetching replies."""
-        api = get_x_api()
+    async def _fetch_thread(api, original_tweet, with_replies: bool = False, reply_limit: int = 30, context=()):
+        """Fetch full thread by walking the inReplyToTweetId chain + fetching replies.
+
+        context holds tweets already parsed from the TweetDetail response; the
+        author's tweets among them are used before any per-hop lookups.
+        """
         author_id = original_tweet.user.id
         author_username = original_tweet.user.username
         conv_id = original_tweet.conversationId if hasattr(original_tweet, 'conversationId') else original_tweet.id
 
-        seen_ids = set()
-        thread_tweets = {}
-        other_replies = {}  # Collect replies from other users
+        # One id set guards both result lists; order is fixed by sorting at the end
+        seen_ids: set[int] = set()
+        thread_tweets: list = []
+        other_replies: list = []  # Collect replies from other users
+        # Converging backward walks share one lookup per tweet id
+        inflight: dict[int, asyncio.Future] = {}
+        # Each lookup holds a TweetDetail account lock; never run more at once
+        # than there are free accounts (1 means the walks go sequentially)
+        detail_slots = asyncio.Semaphore(await _account_slots(api, "TweetDetail"))
+
+        async def tweet_details(cid: int):
+            async with detail_slots:
+                return await api.tweet_details(cid)
+
+        def fetch_details(cid: int) -> asyncio.Future:
+            fut = inflight.get(cid)
+            if fut is None:
+                fut = asyncio.ensure_future(tweet_details(cid))
+                inflight[cid] = fut
+            return fut
 
         async def add_tweet(t):
             """Add tweet to thread if it's from the author and not a reply to others."""
@@ -562,44 +797,48 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
             if _is_reply_to_others(t, author_username):
                 return
             seen_ids.add(t.id)
-            thread_tweets[t.id] = t
+            thread_tweets.append(t)
 
         async def walk_chain_backwards(start_id):
             """Walk backwards via inReplyToTweetId to find all parent tweets."""
             current_id = start_id
             while current_id and current_id not in seen_ids:
-                t = await api.tweet_details(current_id)
+                t = await fetch_details(current_id)
                 if not t:
                     break
                 if t.user.id != author_id:
                     break  # Hit a tweet from another user, stop
+                if t.id in seen_ids:
+                    break  # Another walk reached this tweet first
                 await add_tweet(t)
                 current_id = t.inReplyToTweetId
 
         async def walk_chain_forwards(start_id):
             """Walk forwards by fetching replies and following author's replies."""
-            to_check = [start_id]
-            checked = set()
+            to_check = deque([start_id])
+            scheduled = {start_id}  # ids are queued at most once
             while to_check:
-                current_id = to_check.pop(0)
-                if current_id in checked:
-                    continue
-                checked.add(current_id)
-
-                async with aclosing(api.tweet_replies(current_id, limit=50)) as gen:
+                current_id = to_check.popleft()
+                async with aclosing(_prefetch(api.tweet_replies(current_id, limit=50))) as gen:
                     async for reply in gen:
                         if reply.id in seen_ids:
                             continue
                         if reply.user.id == author_id:
                             await add_tweet(reply)
-                            to_check.append(reply.id)
+                            if reply.id not in scheduled:
+                                scheduled.add(reply.id)
+                                to_check.append(reply.id)
                         elif with_replies and len(other_replies) < reply_limit:
                             # Collect replies from other users
                             seen_ids.add(reply.id)
-                            other_replies[reply.id] = reply
+                            other_replies.append(reply)
 
-        # Step 1: Add original tweet
+        # Step 1: Add original tweet, plus the author's tweets from the same
+        # conversation that TweetDetail returned alongside it
         await add_tweet(original_tweet)
+        for t in context:
+            if t.conversationId == conv_id:
+                await add_tweet(t)
 
         # Step 2: Get tweets from user timeline with same conversationId
         # Lower limit since old threads won't be found anyway, forwards walking handles it
@@ -608,11 +847,15 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
                 if hasattr(t, 'conversationId') and t.conversationId == conv_id:
                     await add_tweet(t)
 
-        # Step 3: Walk backwards from each found tweet to fill gaps
-        for tid in list(thread_tweets.keys()):
-            t = thread_tweets[tid]
-            if t.inReplyToTweetId:
-                await walk_chain_backwards(t.inReplyToTweetId)
+        # Step 3: Walk backwards from each found tweet to fill gaps. The walks
+        # are independent network round trips, so run them concurrently, as
+        # far as the free accounts allow (see fetch_details).
+        roots = {
+            t.inReplyToTweetId
+            for t in thread_tweets
+            if t.inReplyToTweetId and t.inReplyToTweetId not in seen_ids
+        }
+        await asyncio.gather(*(walk_chain_backwards(r) for r in roots))
 
         # Step 4: Walk forwards from original to find any replies we missed
         # Only do this if we need replies from others, or if timeline didn't find the thread
@@ -621,53 +864,50 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
 
         # If we didn't find anything, fall back to just the original
         if not thread_tweets:
-            thread_tweets[original_tweet.id] = original_tweet
+            thread_tweets.append(original_tweet)
 
         # Sort thread by tweet ID (chronological order)
-        thread_result = list(thread_tweets.values())
-        thread_result.sort(key=lambda t: t.id)
+        thread_tweets.sort(key=lambda t: t.id)
 
         # Sort other replies by likes (popularity)
-        replies_result = list(other_replies.values())
-        replies_result.sort(key=lambda t: t.likeCount, reverse=True)
+        other_replies.sort(key=lambda t: t.likeCount, reverse=True)
 
-        return thread_result, replies_result
+        return thread_tweets, other_replies
 
     # Validate: --with-replies requires --thread
     if with_replies and not thread:
         console.print("[yellow]--with-replies requires --thread flag[/yellow]")
         with_replies = False
 
-    replies = []  # Other users' replies
-    article = None  # Article if present
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        desc = f"Fetching thread {tweet_id}..." if thread else f"Fetching tweet {tweet_id}..."
-        if with_replies:
-            desc = f"Fetching thread + replies {tweet_id}..."
-        task = progress.add_task(desc, total=None)
+    with _progress() as progress:
+        task = progress.add_task(f"Fetching tweet {tweet_id}...", total=None)
+
+        async def _main():
+            # One event loop and one API instance for both steps; the spinner
+            # just relabels itself
+            api = get_x_api()
+            tweet, article, context = await _fetch(api)
+            if not tweet or not thread:
+                return tweet, article, [tweet], []
+            desc = f"Fetching thread {tweet_id}..."
+            if with_replies:
+                desc = f"Fetching thread + replies {tweet_id}..."
+            progress.update(task, description=desc)
+            tweets, replies = await _fetch_thread(api, tweet, with_replies, reply_limit, context)
+            return tweet, article, tweets, replies
 
         try:
-            tweet, article = asyncio.run(_fetch())
+            tweet, article, tweets, replies = run_x(_main())
+            progress.stop()
             if not tweet:
-                progress.stop()
                 console.print(f"[yellow]Tweet {tweet_id} not found[/yellow]")
                 return
 
             if thread:
-                tweets, replies = asyncio.run(_fetch_thread(tweet, with_replies, reply_limit))
-                progress.stop()
                 msg = f"[green]Found {len(tweets)} tweets in thread[/green]"
                 if replies:
                     msg += f" [dim]+ {len(replies)} replies[/dim]"
                 console.print(msg)
-            else:
-                tweets = [tweet]
-                progress.stop()
 
         except NoAccountError as e:
             progress.stop()
@@ -682,27 +922,23 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
         if thread and with_replies:
             # Structured output with thread and replies
             data = {
-                "thread": [tweet_to_dict(t) for t in tweets],
-                "replies": [tweet_to_dict(t) for t in replies],
+                "thread": tweets,
+                "replies": replies,
             }
             if article:
                 data["article"] = article.to_dict()
         elif thread:
-            data = [tweet_to_dict(t) for t in tweets]
+            data = tweets
             if article:
                 data = {"thread": data, "article": article.to_dict()}
         else:
-            data = tweet_to_dict(tweets[0])
+            data = tweets[0]
             if article:
                 data = {"tweet": data, "article": article.to_dict()}
-        if output:
-            save_to_file(json.dumps(data, indent=2), output, 'json')
-        if json_output and not output:
-            console.print_json(json.dumps(data, indent=2))
+        _print_json_or_save(data, output, json_output)
     else:
         # Display thread
-        for t in tweets:
-            display_tweet(t)
+        display_tweets(tweets)
         if thread and len(tweets) > 1:
             console.print(f"\n[dim]Thread: {len(tweets)} tweets from @{tweets[0].user.username}[/dim]")
 
@@ -712,11 +948,10 @@ def x_tweet(id_or_url: str, thread: bool, with_replies: bool, reply_limit: int,
 
         # Display replies if any
         if replies:
-            console.print("\n" + "─" * 60)
+            console.print("\n" + _RULE)
             console.print(f"[bold]Replies[/bold] [dim]({len(replies)} sorted by likes)[/dim]")
-            console.print("─" * 60)
-            for t in replies:
-                display_tweet(t)
+            console.print(_RULE)
+            display_tweets(replies)
 
 
 def extract_article_tweet_id(id_or_url: str) -> int:
@@ -727,15 +962,18 @@ def extract_article_tweet_id(id_or_url: str) -> int:
     - https://x.com/i/article/123456789
     - 123456789 (direct ID)
     """
+    if id_or_url.isdecimal():
+        return int(id_or_url)
+
     # Handle article URLs like https://x.com/i/article/123456789
-    article_match = re.search(r'/i/article/(\d+)', id_or_url)
+    article_match = _ARTICLE_RE.search(id_or_url)
     if article_match:
         # Article ID - need to find parent tweet
         # For now, return the article ID and handle specially
         return int(article_match.group(1))
 
     # Handle tweet URLs
-    status_match = re.search(r'/status/(\d+)', id_or_url)
+    status_match = _STATUS_RE.search(id_or_url)
     if status_match:
         return int(status_match.group(1))
 
@@ -758,8 +996,6 @@ def x_article(id_or_url: str, output: Optional[str], json_output: bool, raw: boo
         fcrawl x article 123 -o article.md
         fcrawl x article 123 --json
     """
-    from ..utils.article_parser import parse_article_from_response
-
     try:
         tweet_id = extract_article_tweet_id(id_or_url)
     except ValueError:
@@ -770,15 +1006,11 @@ def x_article(id_or_url: str, output: Optional[str], json_output: bool, raw: boo
         api = get_x_api()
         return await api.tweet_with_article_raw(tweet_id)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task(f"Fetching article from tweet {tweet_id}...", total=None)
 
         try:
-            rep = asyncio.run(_fetch())
+            rep = run_x(_fetch())
             progress.stop()
         except NoAccountError as e:
             progress.stop()
@@ -794,7 +1026,7 @@ def x_article(id_or_url: str, output: Optional[str], json_output: bool, raw: boo
         return
 
     # Parse article from response
-    response_json = rep.json()
+    response_json = orjson.loads(rep.content)
     article = parse_article_from_response(response_json)
 
     if not article:
@@ -803,7 +1035,10 @@ def x_article(id_or_url: str, output: Optional[str], json_output: bool, raw: boo
 
     console.print(f"[green]Found article: {article.title}[/green]")
 
-    if json_output or output:
+    if output and not (output.endswith('.json') or json_output):
+        # Save as markdown; no JSON payload is needed on this path
+        save_to_file(article.to_markdown(), output, 'md')
+    elif json_output or output:
         if raw:
             # Output raw blocks
             data = {
@@ -815,15 +1050,7 @@ def x_article(id_or_url: str, output: Optional[str], json_output: bool, raw: boo
             }
         else:
             data = article.to_dict()
-
-        if output:
-            if output.endswith('.json') or json_output:
-                save_to_file(json.dumps(data, indent=2), output, 'json')
-            else:
-                # Save as markdown
-                save_to_file(article.to_markdown(), output, 'md')
-        if json_output and not output:
-            console.print_json(json.dumps(data, indent=2))
+        _print_json_or_save(data, output, json_output)
     else:
         # Display as markdown
         markdown_content = article.to_markdown()
@@ -854,11 +1081,7 @@ def x_user(handle: str, provider: str, output: Optional[str], json_output: bool)
 
     # twitterapi backend: short-circuit to the helper module.
     if provider == 'twitterapi':
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             progress.add_task(f"Fetching user @{handle} (twitterapi.io)...", total=None)
             user = twitterapi_backend.fetch_user(handle)
             progress.stop()
@@ -868,11 +1091,8 @@ def x_user(handle: str, provider: str, output: Optional[str], json_output: bool)
             return
 
         if json_output or output:
-            data = user_to_dict(user)
-            if output:
-                save_to_file(json.dumps(data, indent=2), output, 'json')
-            if json_output and not output:
-                console.print_json(json.dumps(data, indent=2))
+            data = user
+            _print_json_or_save(data, output, json_output)
         else:
             display_user(user)
         return
@@ -882,15 +1102,11 @@ def x_user(handle: str, provider: str, output: Optional[str], json_output: bool)
         api = get_x_api()
         return await api.user_by_login(handle)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task(f"Fetching user @{handle}...", total=None)
 
         try:
-            user = asyncio.run(_fetch())
+            user = run_x(_fetch())
             progress.stop()
         except NoAccountError as e:
             progress.stop()
@@ -906,15 +1122,22 @@ def x_user(handle: str, provider: str, output: Optional[str], json_output: bool)
         return
 
     if json_output or output:
-        data = user_to_dict(user)
-        if output:
-            save_to_file(json.dumps(data, indent=2), output, 'json')
-        if json_output and not output:
-            console.print_json(json.dumps(data, indent=2))
+        data = user
+        _print_json_or_save(data, output, json_output)
     else:
         display_user(user)
 
 
+async def _fetch_user_tweets(api, handle: str, limit: int):
+    """Return (user, tweets) for a handle's timeline, or (None, []) if unknown."""
+    # First get the user to get their ID
+    user = await api.user_by_login(handle)
+    if not user:
+        return None, []
+
+    return user, await _collect(api.user_tweets(user.id, limit=limit), limit)
+
+
 @x.command(name='tweets')
 @click.argument('handle')
 @click.option('--limit', '-l', type=int, default=20, help='Maximum number of tweets')
@@ -936,11 +1159,7 @@ def x_tweets(handle: str, limit: int, provider: str, output: Optional[str], json
 
     # twitterapi backend: short-circuit to the helper module.
     if provider == 'twitterapi':
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             progress.add_task(f"Fetching tweets from @{handle} (twitterapi.io)...", total=None)
             user, tweets = twitterapi_backend.fetch_user_tweets(handle, limit=limit)
             progress.stop()
@@ -955,42 +1174,29 @@ def x_tweets(handle: str, limit: int, provider: str, output: Optional[str], json
         console.print(f"[green]Found {len(tweets)} tweets from @{handle}[/green]")
 
         if json_output or output:
-            data = [tweet_to_dict(t) for t in tweets]
-            if output:
-                save_to_file(json.dumps(data, indent=2), output, 'json')
-            if json_output and not output:
-                console.print_json(json.dumps(data, indent=2))
+            data = tweets
+            _print_json_or_save(data, output, json_output)
         else:
-            for tweet in tweets:
-                display_tweet(tweet)
-            console.print("=" * 60)
+            display_tweets(tweets)
+            console.print(_DIVIDER)
         return
 
     # twscrape backend (original path) -----------------------------------
     async def _fetch():
         api = get_x_api()
-        # First get the user to get their ID
+        if not output:
+            return await _fetch_user_tweets(api, handle, limit)
+        # Saved as pages arrive; -o shows nothing else, so keep no list
         user = await api.user_by_login(handle)
         if not user:
-            return None, []
-
-        results = []
-        async with aclosing(api.user_tweets(user.id, limit=limit)) as gen:
-            async for tweet in gen:
-                results.append(tweet)
-                if len(results) >= limit:
-                    break
-        return user, results
+            return None, 0
+        return user, await _stream_json(api.user_tweets(user.id, limit=limit), limit, output)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task(f"Fetching tweets from @{handle}...", total=None)
 
         try:
-            user, tweets = asyncio.run(_fetch())
+            user, result = run_x(_fetch())
             progress.stop()
         except NoAccountError as e:
             progress.stop()
@@ -1005,22 +1211,87 @@ def x_tweets(handle: str, limit: int, provider: str, output: Optional[str], json
         console.print(f"[yellow]User @{handle} not found[/yellow]")
         return
 
-    if not tweets:
+    found = result if output else len(result)
+    if not found:
         console.print(f"[yellow]No tweets found for @{handle}[/yellow]")
         return
 
-    console.print(f"[green]Found {len(tweets)} tweets from @{handle}[/green]")
+    console.print(f"[green]Found {found} tweets from @{handle}[/green]")
 
-    if json_output or output:
-        data = [tweet_to_dict(t) for t in tweets]
-        if output:
-            save_to_file(json.dumps(data, indent=2), output, 'json')
-        if json_output and not output:
-            console.print_json(json.dumps(data, indent=2))
+    if output:
+        console.print(f"[green]✓ Saved to {output}[/green]")
+    elif json_output:
+        _print_json_or_save(result, None, json_output)
     else:
-        for tweet in tweets:
-            display_tweet(tweet)
-        console.print("=" * 60)
+        display_tweets(result)
+        console.print(_DIVIDER)
+
+
+@x.command(name='tweets-batch')
+@click.argument('handles_file', type=click.File('r'))
+@click.option('--limit', '-l', type=int, default=20, help='Maximum number of tweets per handle')
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=4,
+              help='Handles fetched at once, up to one per free account (default: 4)')
+@click.option('-o', '--output', help='Save output to file')
+@click.option('--json', 'json_output', is_flag=True, help='Output as JSON')
+def x_tweets_batch(handles_file, limit: int, concurrency: int, output: Optional[str], json_output: bool):
+    """Fetch timelines for many handles (one per line) in a single run.
+
+    Handles are fetched concurrently over one event loop and one API instance
+    instead of one `fcrawl x tweets` process per handle. JSON output maps each
+    handle to its tweets, or null when the user does not exist.
+
+    \b
+    Examples:
+        fcrawl x tweets-batch handles.txt
+        fcrawl x tweets-batch handles.txt --limit 50 -c 8 -o timelines.json
+        cat handles.txt | fcrawl x tweets-batch - --json
+    """
+    handles = list(dict.fromkeys(
+        line.strip().lstrip('@') for line in handles_file if line.strip()
+    ))
+    if not handles:
+        console.print("[yellow]No handles given[/yellow]")
+        return
+
+    async def _fetch():
+        return await _fetch_batch(get_x_api(), handles, limit, concurrency)
+
+    with _progress() as progress:
+        task = progress.add_task(f"Fetching tweets from {len(handles)} handles...", total=None)
+
+        try:
+            results = run_x(_fetch())
+            progress.stop()
+        except NoAccountError as e:
+            progress.stop()
+            _handle_no_account_error(e)
+            raise click.Abort()
+        except Exception as e:
+            progress.stop()
+            console.print(f"[red]Error: {e}[/red]")
+            raise click.Abort()
+
+    found = sum(len(tweets) for _, tweets in results)
+    console.print(f"[green]Found {found} tweets from {len(handles)} handles[/green]")
+
+    if json_output or output:
+        data = {
+            handle: tweets if user is not None else None
+            for handle, (user, tweets) in zip(handles, results)
+        }
+        _print_json_or_save(data, output, json_output)
+        return
+
+    for handle, (user, tweets) in zip(handles, results):
+        if user is None:
+            console.print(f"[yellow]User @{handle} not found[/yellow]")
+        elif not tweets:
+            console.print(f"[yellow]No tweets found for @{handle}[/yellow]")
+        else:
+            console.print(f"\n[bold]@{handle}[/bold] [dim]({len(tweets)} tweets)[/dim]")
+            display_tweets(tweets)
+    console.print(_DIVIDER)
 
 
 @x.group(name='accounts', invoke_without_command=True)
@@ -1046,7 +1317,7 @@ def _list_accounts():
         return await pool.accounts_info()
 
     try:
-        accounts = asyncio.run(_fetch())
+        accounts = run_x(_fetch())
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise click.Abort()
@@ -1058,6 +1329,8 @@ def _list_accounts():
         console.print("\nThen run: [bold]fcrawl x accounts add <file>[/bold]")
         return
 
+    from rich.table import Table
+
     table = Table(title="X/Twitter Accounts")
     table.add_column("Username", style="cyan")
     table.add_column("Active", style="green")
@@ -1101,7 +1374,9 @@ def _list_accounts():
 @click.argument('file', type=click.Path(exists=True))
 @click.option('--format', '-f', 'line_format', default='username:password:email:email_password',
               help='Line format (default: username:password:email:email_password)')
-def x_accounts_add(file: str, line_format: str):
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=8,
+              help='Accounts logged in at once (default: 8)')
+def x_accounts_add(file: str, line_format: str, concurrency: int):
     """Add accounts from a file.
 
     \b
@@ -1117,17 +1392,13 @@ def x_accounts_add(file: str, line_format: str):
         pool = get_x_pool()
         await pool.load_from_file(file, line_format)
         # Try to login
-        return await pool.login_all()
+        return await pool.login_all(concurrency=concurrency)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task("Adding and logging in accounts...", total=None)
 
         try:
-            result = asyncio.run(_add())
+            result = run_x(_add())
             progress.stop()
         except Exception as e:
             progress.stop()
@@ -1153,7 +1424,7 @@ def x_accounts_reset():
         await pool.reset_locks()
 
     try:
-        asyncio.run(_reset())
+        run_x(_reset())
         console.print("[green]All account locks have been reset.[/green]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -1162,7 +1433,9 @@ def x_accounts_reset():
 
 @x_accounts.command(name='login')
 @click.argument('username', required=False)
-def x_accounts_login(username: Optional[str]):
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=8,
+              help='Accounts logged in at once (default: 8)')
+def x_accounts_login(username: Optional[str], concurrency: int):
     """Login accounts (all inactive or specific username).
 
     \b
@@ -1175,17 +1448,13 @@ def x_accounts_login(username: Optional[str]):
         if username:
             return await pool.login_all([username])
         else:
-            return await pool.login_all()
+            return await pool.login_all(concurrency=concurrency)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         task = progress.add_task("Logging in accounts...", total=None)
 
         try:
-            result = asyncio.run(_login())
+            result = run_x(_login())
             progress.stop()
         except Exception as e:
             progress.stop()
@@ -1219,7 +1488,9 @@ def x_accounts_add_tokens(ct0: str, auth_token: str, username: Optional[str]):
     # Auto-generate username if not provided
     if not username:
         hash_input = f"{ct0[:16]}{auth_token[:16]}"
-        short_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
+        # md5 keeps names stable with accounts added by earlier versions; it is
+        # only a label, not a security boundary
+        short_hash = hashlib.md5(hash_input.encode(), usedforsecurity=False).hexdigest()[:8]
         username = f"token_{short_hash}"
 
     async def _add():
@@ -1227,7 +1498,7 @@ def x_accounts_add_tokens(ct0: str, auth_token: str, username: Optional[str]):
         return await pool.add_account_from_tokens(username, ct0, auth_token)
 
     try:
-        success = asyncio.run(_add())
+        success = run_x(_add())
         if success:
             console.print(f"[green]Account '{username}' added successfully[/green]")
             console.print("  Status: active, logged_in")
@@ -284,6 +284,8 @@ def yt_channel(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             progress.add_task(f"Fetching channel videos...", total=None)
             result = explorer.get_channel_videos(
@@ -229,6 +229,8 @@ def yt_search(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             progress.add_task("Searching YouTube...", total=None)
             result = searcher.search_videos(
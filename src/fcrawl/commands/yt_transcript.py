@@ -654,6 +654,8 @@ def yt_transcript(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console,
+                refresh_per_second=4,
+                transient=True,
             ) as progress:
                 progress.add_task("Fetching available languages...", total=None)
                 result = downloader.get_available_languages(url)
@@ -665,6 +667,8 @@ def yt_transcript(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console,
+                refresh_per_second=4,
+                transient=True,
             ) as progress:
                 progress.add_task("Fetching transcript...", total=None)
                 result = downloader.get_transcript(url, preferred_lang=lang)
@@ -6,6 +6,8 @@ import shutil
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 CACHE_DIR = Path("/tmp/fcrawl-cache")
 
 
@@ -27,8 +29,8 @@ def read_cache(command: str, key: str) -> Optional[dict]:
     path = get_cache_path(command, key)
     if path.exists():
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, IOError):
+            return orjson.loads(path.read_bytes())
+        except (orjson.JSONDecodeError, IOError):
             return None
     return None
 
@@ -60,13 +62,15 @@ def result_to_dict(result) -> dict:
         data["html"] = result.html
     if hasattr(result, "links"):
         data["links"] = result.links
-    if hasattr(result, "metadata") and result.metadata:
-        md = result.metadata
-        data["metadata"] = md.__dict__ if hasattr(md, "__dict__") else md
-    if hasattr(result, "source_provider") and result.source_provider:
-        data["source_provider"] = result.source_provider
-    if hasattr(result, "fallback_url") and result.fallback_url:
-        data["fallback_url"] = result.fallback_url
+    md = getattr(result, "metadata", None)
+    if md:
+        data["metadata"] = getattr(md, "__dict__", md)
+    source_provider = getattr(result, "source_provider", None)
+    if source_provider:
+        data["source_provider"] = source_provider
+    fallback_url = getattr(result, "fallback_url", None)
+    if fallback_url:
+        data["fallback_url"] = fallback_url
     return data
 
 
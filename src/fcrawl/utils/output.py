@@ -1,10 +1,13 @@
 """Output handling utilities for fcrawl"""
 
-import json
+import dataclasses
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
+
+import orjson
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.syntax import Syntax
@@ -62,6 +65,57 @@ def resolve_pretty(pretty: Optional[bool]) -> bool:
     return pretty
 
 
+def dump_json(
+    data: Any, pretty: bool = True, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Encode data as UTF-8 JSON bytes with orjson (2-space indent if pretty)
+
+    With a default hook, dataclasses are handed to it instead of being
+    encoded field by field.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    if default is not None:
+        option |= orjson.OPT_PASSTHROUGH_DATACLASS
+    return orjson.dumps(data, default=default, option=option)
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps fallback matching what orjson encodes natively"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def emit_json(
+    data: Any, pretty: bool = True, default: Optional[Callable[[Any], Any]] = None
+):
+    """Print JSON to stdout.
+
+    Highlighting only helps a human at a terminal; when stdout is piped the
+    encoded bytes go straight to the underlying buffer without Rich.
+    """
+    if pretty and sys.stdout.isatty():
+        console.print_json(data=data, default=default or _json_default)
+        return
+
+    emit_json_stream((dump_json(data, pretty, default),))
+
+
+def emit_json_stream(chunks: Iterable[bytes]):
+    """Write pre-encoded JSON chunks to stdout as they are produced, then a newline."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(b"".join(chunks).decode())
+        return
+    sys.stdout.flush()
+    for chunk in chunks:
+        buffer.write(chunk)
+    buffer.write(b"\n")
+    buffer.flush()
+
+
 def display_content(content: Any, format_type: str = "markdown", pretty: bool = True):
     """Display content in the terminal with formatting"""
     if not pretty or not sys.stdout.isatty():
@@ -74,8 +128,8 @@ def display_content(content: Any, format_type: str = "markdown", pretty: bool =
         console.print(md)
     elif format_type == "json":
         if isinstance(content, str):
-            content = json.loads(content)
-        syntax = Syntax(json.dumps(content, indent=2), "json", theme="monokai")
+            content = orjson.loads(content)
+        syntax = Syntax(dump_json(content).decode(), "json", theme="monokai")
         console.print(syntax)
     elif format_type == "html":
         syntax = Syntax(content, "html", theme="monokai")
@@ -102,12 +156,20 @@ def save_to_file(content: Any, filepath: str, format_type: str = "markdown"):
     # Create parent directories if they don't exist
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    if format_type == "json":
-        with open(path, "w") as f:
-            if isinstance(content, str):
+    if isinstance(content, bytes):
+        # Pre-encoded payloads (e.g. from orjson) skip the decode/encode trip
+        path.write_bytes(content)
+    elif isinstance(content, Iterator):
+        # Streamed payloads arrive as encoded chunks
+        with open(path, "wb") as f:
+            for chunk in content:
+                f.write(chunk)
+    elif format_type == "json":
+        if isinstance(content, str):
+            with open(path, "w") as f:
                 f.write(content)
-            else:
-                json.dump(content, f, indent=2)
+        else:
+            path.write_bytes(dump_json(content))
     else:
         with open(path, "w") as f:
             f.write(str(content))
@@ -158,7 +220,7 @@ def handle_output(
     if json_output:
         if hasattr(content, "__dict__"):
             content = content.__dict__
-        output_content = json.dumps(content, indent=2 if pretty else None)
+        output_content = dump_json(content, pretty).decode()
         format_type = "json"
     else:
         if isinstance(content, dict):
@@ -184,11 +246,11 @@ def handle_output(
             path = Path(output_file)
             path.parent.mkdir(parents=True, exist_ok=True)
             if format_type == "json":
-                with open(path, "w") as f:
-                    if isinstance(output_content, str):
+                if isinstance(output_content, str):
+                    with open(path, "w") as f:
                         f.write(output_content)
-                    else:
-                        json.dump(output_content, f, indent=2)
+                else:
+                    path.write_bytes(dump_json(output_content))
             else:
                 with open(path, "w") as f:
                     f.write(str(output_content))
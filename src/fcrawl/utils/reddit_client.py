@@ -5,6 +5,7 @@ Appending .json to any Reddit URL returns structured JSON data.
 Rate limit: ~100 req/min per IP (more than enough for CLI use).
 """
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -36,14 +37,59 @@ class RedditClient:
         Returns:
             Parsed JSON response
         """
+        resp = self._request(path, params)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def get_conditional(
+        self,
+        path: str,
+        params: dict | None = None,
+        validators: dict | None = None,
+    ) -> tuple[dict | None, dict]:
+        """GET like get(), revalidating against a previously seen response.
+
+        Args:
+            path: Reddit URL path
+            params: Query parameters
+            validators: {"etag": ..., "last_modified": ...} from an earlier call
+
+        Returns:
+            (parsed JSON, validators), or (None, validators) when Reddit
+            answers 304 Not Modified
+        """
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        resp = self._request(path, params, headers=headers)
+        if resp.status_code == 304:
+            return None, validators or {}
+        resp.raise_for_status()
+
+        fresh = {}
+        if resp.headers.get("ETag"):
+            fresh["etag"] = resp.headers["ETag"]
+        if resp.headers.get("Last-Modified"):
+            fresh["last_modified"] = resp.headers["Last-Modified"]
+        return orjson.loads(resp.content), fresh
+
+    def _request(
+        self,
+        path: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        """Issue the GET for reddit.com/{path}.json."""
         url = f"https://www.reddit.com/{path}"
         if not url.endswith(".json"):
             url += ".json"
         params = params or {}
         params["raw_json"] = 1  # Avoid HTML entity escaping
-        resp = self.session.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        return resp.json()
+        return self.session.get(url, params=params, headers=headers, timeout=15)
 
     def resolve_share_url(self, url: str) -> str:
         """Resolve a Reddit share URL by following redirects."""
@@ -1,9 +1,16 @@
 """X/Twitter client utilities for fcrawl"""
 
+import asyncio
 import os
+from collections.abc import Coroutine
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, TypeVar
 
 from ..vendors.twscrape import API, AccountsPool
+from ..vendors.twscrape.account import close_shared_transport
+
+T = TypeVar("T")
 
 
 def get_x_config_dir() -> Path:
@@ -13,13 +20,19 @@ def get_x_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_x_db_path() -> str:
     """Return the path to the X accounts database."""
     return str(get_x_config_dir() / "x_accounts.db")
 
 
+@lru_cache(maxsize=2)
 def get_x_api(raise_when_no_account: bool = True) -> API:
-    """Return a configured twscrape API instance.
+    """Return the shared twscrape API instance for this setting.
+
+    Like the pool, the API holds no connections of its own: SQLite is
+    opened per operation and HTTP clients per request, with the shared
+    transport closed by run_x. One instance per flag is cached.
 
     Args:
         raise_when_no_account: If True, raise NoAccountError when no accounts available.
@@ -32,7 +45,39 @@ def get_x_api(raise_when_no_account: bool = True) -> API:
     return API(pool=db_path, raise_when_no_account=raise_when_no_account)
 
 
+@lru_cache(maxsize=1)
 def get_x_pool() -> AccountsPool:
-    """Return an AccountsPool instance for direct account management."""
+    """Return the shared AccountsPool instance for direct account management.
+
+    The pool only holds the database path and opens SQLite per operation, so
+    one instance is safe to reuse across event loops.
+    """
     db_path = get_x_db_path()
     return AccountsPool(db_file=db_path)
+
+
+def run_x(main: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() for twscrape work.
+
+    Account clients on the loop share one keep-alive connection pool; it is
+    closed here, before the loop shuts down, since it cannot outlive it.
+    Runs on uvloop when it is installed (``pip install uvloop``).
+    """
+
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            await close_shared_transport()
+
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(_run())
+
+
+def _loop_factory():
+    """Return uvloop's loop factory when uvloop is installed, else None (stdlib loop)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
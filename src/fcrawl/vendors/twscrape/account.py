@@ -1,12 +1,14 @@
 """Account model for twscrape"""
 
+import asyncio
 import json
 import os
 import sqlite3
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
-from httpx import AsyncClient, AsyncHTTPTransport
+from httpx import AsyncClient, AsyncHTTPTransport, Limits
 
 from .models import JSONTrait
 from .utils import utc
@@ -14,6 +16,38 @@ from .utils import utc
 TOKEN = "Bearer AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA"
 
 
+class _SharedTransport(AsyncHTTPTransport):
+    """Connection pool shared by account clients; closing a client leaves it open."""
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await super().aclose()
+
+
+# One keep-alive pool per event loop, so back-to-back requests from different
+# QueueClient contexts reuse TCP/TLS connections. Cookies and headers stay on
+# each account's AsyncClient; only sockets are shared.
+_SHARED_TRANSPORTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def shared_transport() -> _SharedTransport:
+    loop = asyncio.get_running_loop()
+    transport = _SHARED_TRANSPORTS.get(loop)
+    if transport is None:
+        limits = Limits(max_connections=100, max_keepalive_connections=20)
+        transport = _SharedTransport(retries=3, limits=limits)
+        _SHARED_TRANSPORTS[loop] = transport
+    return transport
+
+
+async def close_shared_transport() -> None:
+    transport = _SHARED_TRANSPORTS.pop(asyncio.get_running_loop(), None)
+    if transport is not None:
+        await transport.close()
+
+
 @dataclass
 class Account(JSONTrait):
     username: str
@@ -55,12 +89,16 @@ class Account(JSONTrait):
         rs["last_used"] = rs["last_used"].isoformat() if rs["last_used"] else None
         return rs
 
-    def make_client(self, proxy: str | None = None) -> AsyncClient:
+    def make_client(self, proxy: str | None = None, shared: bool = False) -> AsyncClient:
         proxies = [proxy, os.getenv("TWS_PROXY"), self.proxy]
         proxies = [x for x in proxies if x is not None]
         proxy = proxies[0] if proxies else None
 
-        transport = AsyncHTTPTransport(retries=3)
+        # proxied traffic goes through the client's own proxy mount either way
+        if shared and proxy is None:
+            transport = shared_transport()
+        else:
+            transport = AsyncHTTPTransport(retries=3)
         client = AsyncClient(proxy=proxy, follow_redirects=True, transport=transport)
 
         # saved from previous usage
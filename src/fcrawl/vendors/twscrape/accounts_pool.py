@@ -238,7 +238,7 @@ class AccountsPool:
         finally:
             await self.save(account)
 
-    async def login_all(self, usernames: list[str] | None = None):
+    async def login_all(self, usernames: list[str] | None = None, concurrency: int = 1):
         if usernames is None:
             qs = "SELECT * FROM accounts WHERE active = false AND error_msg IS NULL"
         else:
@@ -247,14 +247,23 @@ class AccountsPool:
 
         rs = await fetchall(self._db_file, qs)
         accounts = [Account.from_rs(rs) for rs in rs]
-        # await asyncio.gather(*[login(x) for x in self.accounts])
-
-        counter = {"total": len(accounts), "success": 0, "failed": 0}
-        for i, x in enumerate(accounts, start=1):
-            logger.info(f"[{i}/{len(accounts)}] Logging in {x.username} - {x.email}")
-            status = await self.login(x)
-            counter["success" if status else "failed"] += 1
-        return counter
+
+        # Logins are independent and mostly wait on the network (and on the
+        # email inbox for verification codes), so up to `concurrency` of them
+        # run at once. self.login never raises; db writes are serialized.
+        # Manual mode prompts for codes on stdin, so it stays one at a time.
+        if self._login_config.manual:
+            concurrency = 1
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(i: int, x: Account) -> bool:
+            async with sem:
+                logger.info(f"[{i}/{len(accounts)}] Logging in {x.username} - {x.email}")
+                return await self.login(x)
+
+        results = await asyncio.gather(*(one(i, x) for i, x in enumerate(accounts, start=1)))
+        success = sum(results)
+        return {"total": len(accounts), "success": success, "failed": len(accounts) - success}
 
     async def relogin(self, usernames: str | list[str]):
         usernames = usernames if isinstance(usernames, list) else [usernames]
@@ -6,6 +6,7 @@ import imaplib
 import os
 import time
 from datetime import datetime
+from email.utils import getaddresses
 
 from .logger import logger
 
@@ -51,7 +52,9 @@ def _get_imap_domain(email: str) -> str:
     return f"imap.{email_domain}"
 
 
-def _wait_email_code(imap: imaplib.IMAP4_SSL, count: int, min_t: datetime | None) -> str | None:
+def _wait_email_code(
+    imap: imaplib.IMAP4_SSL, count: int, min_t: datetime | None, email: str | None = None
+) -> str | None:
     for i in range(count, 0, -1):
         _, rep = imap.fetch(str(i), "(RFC822)")
         for x in rep:
@@ -69,6 +72,13 @@ def _wait_email_code(imap: imaplib.IMAP4_SSL, count: int, min_t: datetime | None
                 if min_t is not None and msg_time < min_t:
                     return None
 
+                # Logins can run concurrently against a shared (catch-all or
+                # forwarding) inbox; only take the code sent to this account.
+                if email is not None:
+                    msg_to = {addr.lower() for _, addr in getaddresses(msg.get_all("To", []))}
+                    if email.lower() not in msg_to:
+                        continue
+
                 if "info@x.com" in msg_from and "confirmation code is" in msg_subj:
                     # eg. Your Twitter confirmation code is XXX
                     return msg_subj.split(" ")[-1].strip()
@@ -83,9 +93,10 @@ async def imap_get_email_code(
         logger.info(f"Waiting for confirmation code for {email}...")
         start_time = time.time()
         while True:
-            _, rep = imap.select("INBOX")
+            # imaplib blocks; run it off the event loop so other logins proceed
+            _, rep = await asyncio.to_thread(imap.select, "INBOX")
             msg_count = int(rep[0].decode("utf-8")) if len(rep) > 0 and rep[0] is not None else 0
-            code = _wait_email_code(imap, msg_count, min_t)
+            code = await asyncio.to_thread(_wait_email_code, imap, msg_count, min_t, email)
             if code is not None:
                 return code
 
@@ -101,11 +112,11 @@ async def imap_get_email_code(
 
 async def imap_login(email: str, password: str):
     domain = _get_imap_domain(email)
-    imap = imaplib.IMAP4_SSL(domain)
+    imap = await asyncio.to_thread(imaplib.IMAP4_SSL, domain)
 
     try:
-        imap.login(email, password)
-        imap.select("INBOX", readonly=True)
+        await asyncio.to_thread(imap.login, email, password)
+        await asyncio.to_thread(imap.select, "INBOX", readonly=True)
     except imaplib.IMAP4.error as e:
         logger.error(f"Error logging into {email} on {domain}: {e}")
         raise EmailLoginError() from e
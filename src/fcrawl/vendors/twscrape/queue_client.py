@@ -203,7 +203,7 @@ class QueueClient:
         if acc is None:
             return None
 
-        clt = acc.make_client(proxy=self.proxy)
+        clt = acc.make_client(proxy=self.proxy, shared=True)
         self.ctx = Ctx(acc, clt)
         return self.ctx
 
@@ -0,0 +1,60 @@
+"""Unit tests for JSON helpers in fcrawl.utils.output.
+
+Run with: uv run pytest tests/test_output.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass
+
+from fcrawl.utils.output import dump_json, emit_json, save_to_file
+
+
+def test_dump_json_matches_stdlib_layout():
+    data = {"a": [1, 2], "b": {"c": "Café"}}
+    assert dump_json(data).decode() == json.dumps(data, indent=2, ensure_ascii=False)
+    assert json.loads(dump_json(data, pretty=False)) == data
+
+
+def test_dump_json_accepts_non_str_keys():
+    assert json.loads(dump_json({1: "one"}, pretty=False)) == {"1": "one"}
+
+
+def test_emit_json_writes_plain_bytes_when_piped(capsys):
+    emit_json({"title": "Café", "score": 1}, pretty=False)
+    out = capsys.readouterr().out
+    assert json.loads(out) == {"title": "Café", "score": 1}
+    assert "\x1b[" not in out
+
+
+def test_emit_json_indents_when_pretty(capsys):
+    emit_json({"a": [1, 2]}, pretty=True)
+    out = capsys.readouterr().out
+    assert out == '{\n  "a": [\n    1,\n    2\n  ]\n}\n'
+
+
+def test_save_to_file_writes_bytes_and_chunks(tmp_path):
+    save_to_file(b'{"a":1}', str(tmp_path / "one.json"), "json")
+    save_to_file(iter([b"[1,", b"2]"]), str(tmp_path / "two.json"), "json")
+    save_to_file({"b": 2}, str(tmp_path / "three.json"), "json")
+    assert (tmp_path / "one.json").read_bytes() == b'{"a":1}'
+    assert (tmp_path / "two.json").read_bytes() == b"[1,2]"
+    assert json.loads((tmp_path / "three.json").read_text()) == {"b": 2}
+
+
+def test_emit_json_tty_handles_dataclasses(monkeypatch, capsys):
+    @dataclass(slots=True)
+    class Meta:
+        count: int
+        from_cache: bool
+
+    meta = Meta(count=2, from_cache=False)
+    assert dump_json(meta) == dump_json({"count": 2, "from_cache": False})
+
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    emit_json({"meta": meta}, pretty=True)
+    out = capsys.readouterr().out
+    assert '"count": 2' in out
+    assert '"from_cache": false' in out
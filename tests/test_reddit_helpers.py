@@ -0,0 +1,227 @@
+"""Unit tests for the pure helpers in fcrawl.commands.reddit.
+
+No network access — these exercise formatting and parsing only.
+
+Run with: uv run pytest tests/test_reddit_helpers.py -v
+"""
+
+from __future__ import annotations
+
+import click
+import pytest
+
+from fcrawl.commands.reddit import (
+    _POST_DEFAULTS,
+    _POST_GET,
+    _fetch_many_with_cache,
+    _fetch_with_cache,
+    _format_age,
+    _iter_post_json,
+    _normalize_subreddit,
+    _normalize_username,
+    _parse_post_target,
+    _row,
+    _strip_query,
+    _truncate,
+    comment_to_dict,
+    display_user_activity,
+)
+from fcrawl.utils import cache
+from fcrawl.utils.output import dump_json
+
+
+# ---- row extraction ---------------------------------------------------------
+
+
+def test_row_returns_present_fields():
+    data = {
+        "subreddit": "python",
+        "title": "Hello",
+        "score": 12,
+        "created_utc": 1.0,
+        "permalink": "/r/python/comments/abc123/hello/",
+        "extra": "ignored",
+    }
+    assert _row(data, _POST_GET, _POST_DEFAULTS) == (
+        "python",
+        "Hello",
+        12,
+        1.0,
+        "/r/python/comments/abc123/hello/",
+    )
+
+
+def test_row_falls_back_to_defaults_for_missing_keys():
+    assert _row({"title": "Only title"}, _POST_GET, _POST_DEFAULTS) == (
+        "",
+        "Only title",
+        0,
+        None,
+        "",
+    )
+
+
+def test_display_user_activity_plain_output(capsys):
+    items = [
+        {"kind": "t3", "data": {"subreddit": "python", "title": "Hi", "score": 1500}},
+        {"kind": "t1", "data": {"subreddit": "rust", "body": "Nice", "score": 3}},
+    ]
+    display_user_activity(items, pretty=False)
+    out = capsys.readouterr().out
+    assert "[post] r/python 1.5K pts unknown" in out
+    assert "[comment] r/rust 3 pts unknown" in out
+    assert "  Nice" in out
+
+
+# ---- post target parsing ----------------------------------------------------
+
+
+def test_parse_post_target_variants():
+    expected = "comments/abc123"
+    for target in (
+        "abc123",
+        "ABC123",
+        "https://www.reddit.com/r/python/comments/abc123/some_title/",
+        "https://old.reddit.com/r/python/comments/abc123/some_title/?utm=x#c",
+        "reddit.com/comments/abc123",
+        "https://redd.it/abc123",
+        "/r/python/comments/abc123/slug/",
+    ):
+        assert _parse_post_target(target) == expected, target
+
+
+def test_strip_query():
+    assert _strip_query("  https://x.com/a/?b=1#c ") == "https://x.com/a"
+    assert _strip_query("https://x.com/a#c?b") == "https://x.com/a"
+    assert _strip_query("/r/python/") == "/r/python"
+
+
+# ---- relative ages ----------------------------------------------------------
+
+
+def test_format_age_buckets():
+    now = 1_700_000_000.0
+    assert _format_age(None, now) == "unknown"
+    assert _format_age(now - 30, now) == "just now"
+    assert _format_age(now - 5 * 60, now) == "5m ago"
+    assert _format_age(now - 3 * 3600, now) == "3h ago"
+    assert _format_age(now - 2 * 86400, now) == "2d ago"
+    assert _format_age(now - 65 * 86400, now) == "2mo ago"
+    assert _format_age(now - 800 * 86400, now) == "2y ago"
+
+
+# ---- streamed post JSON -----------------------------------------------------
+
+
+def _post_envelope_cases():
+    post = {"id": "abc123", "title": "Hi\nthere", "score": 5}
+    meta = {"sort": "top", "depth": 3, "from_cache": False}
+    comments = [
+        {"id": "c1", "body": "a", "replies": [{"id": "c2", "body": "b"}]},
+        {"id": "c3", "body": "Café", "replies": []},
+    ]
+    return post, meta, [comments, []]
+
+
+def test_iter_post_json_matches_single_encode():
+    post, meta, comment_sets = _post_envelope_cases()
+    for comments in comment_sets:
+        for pretty in (True, False):
+            expected = dump_json(
+                {"post": post, "comments": comments, "meta": meta}, pretty
+            )
+            streamed = b"".join(_iter_post_json(post, iter(comments), meta, pretty))
+            assert streamed == expected
+
+
+def test_truncate():
+    assert _truncate(None) == ""
+    assert _truncate("  short  ") == "short"
+    assert _truncate("two\nlines", 20) == "two lines"
+    assert _truncate("x" * 10, 8) == "xxxxx..."
+    assert _truncate("  " + "y" * 8 + "  ", 8) == "y" * 8
+
+
+# ---- conditional revalidation -----------------------------------------------
+
+
+class _FakeClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.seen_validators = []
+
+    def get_conditional(self, path, params=None, validators=None):
+        self.seen_validators.append(validators)
+        return self.responses.pop(0)
+
+
+def test_fetch_with_cache_revalidates_with_etag(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    body = {"data": {"children": []}}
+    first = _FakeClient([(body, {"etag": '"v1"'})])
+    result, from_cache = _fetch_with_cache(
+        first, "reddit-test", "r/python/hot", {}, True, False, "..."
+    )
+    assert (result, from_cache) == (body, False)
+
+    second = _FakeClient([(None, {"etag": '"v1"'})])
+    result, from_cache = _fetch_with_cache(
+        second, "reddit-test", "r/python/hot", {}, True, False, "..."
+    )
+    assert (result, from_cache) == (body, True)
+    assert second.seen_validators == [{"etag": '"v1"'}]
+
+
+def test_normalize_names():
+    assert _normalize_subreddit("  R/Python/ ") == "Python"
+    assert _normalize_subreddit("/r/rust") == "rust"
+    assert _normalize_username("u/spez\n") == "spez"
+    assert _normalize_username("U/spez") == "spez"
+    with pytest.raises(click.BadParameter):
+        _normalize_subreddit(" / ")
+
+
+def test_fetch_many_with_cache_mixes_hits_and_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    cache.write_cache("reddit-test", cache.cache_key("user/a/about", {}), {"hit": 1})
+
+    class Client:
+        def get_conditional(self, path, params=None, validators=None):
+            return {"path": path}, {}
+
+    results = _fetch_many_with_cache(
+        Client(),
+        [
+            ("reddit-test", "user/a/about", {}),
+            ("reddit-test", "user/a/overview", {"limit": 5}),
+            ("reddit-test", "user/a/comments", {}),
+        ],
+        no_cache=False,
+        cache_only=False,
+        progress_label="...",
+    )
+    assert results == [
+        ({"hit": 1}, True),
+        ({"path": "user/a/overview"}, False),
+        ({"path": "user/a/comments"}, False),
+    ]
+
+
+def test_comment_to_dict_handles_deep_threads():
+    leaf = {"kind": "t1", "data": {"id": "leaf", "replies": ""}}
+    node = leaf
+    for i in range(3000):
+        node = {
+            "kind": "t1",
+            "data": {
+                "id": f"c{i}",
+                "replies": {"data": {"children": [{"kind": "more"}, node]}},
+            },
+        }
+    result = comment_to_dict(node, max_depth=5000)
+    depth = 0
+    while "replies" in result:
+        assert len(result["replies"]) == 1
+        result = result["replies"][0]
+        depth += 1
+    assert (result["id"], result["depth"], depth) == ("leaf", 3000, 3000)
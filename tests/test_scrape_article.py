@@ -0,0 +1,75 @@
+"""Unit tests for article-mode markdown cleanup in fcrawl.commands.scrape.
+
+Run with: uv run pytest tests/test_scrape_article.py -v
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from fcrawl.commands.scrape import (
+    clean_article_content,
+    format_with_metadata,
+    save_article_stream,
+)
+
+SAMPLE = """# Title
+Close
+* [](https://twitter.com/intent/tweet?url=x)
+* [Share](https://facebook.com/sharer/sharer.php?u=x)
+Share this article
+Tweet
+  US  
+
+Real paragraph one.
+
+
+Real paragraph two mentions Subscribe mid-line.
+Subscribe to our newsletter
+sign up today
+Start Now
+End."""
+
+
+def test_clean_article_content_drops_noise_lines():
+    assert clean_article_content(SAMPLE) == (
+        "# Title\n"
+        "Real paragraph one.\n"
+        "Real paragraph two mentions Subscribe mid-line.\n"
+        "End."
+    )
+
+
+def test_clean_article_content_keeps_clean_text():
+    text = "First line\nSecond line"
+    assert clean_article_content(text) == text
+
+
+def test_save_article_stream_matches_in_memory_cleanup(tmp_path):
+    result = SimpleNamespace(source_provider="firecrawl", metadata=None)
+    path = tmp_path / "nested" / "article.md"
+    for text in (SAMPLE, SAMPLE + "\nTweet\n", "Only text\n"):
+        save_article_stream(result, text, str(path))
+        assert path.read_text() == format_with_metadata(
+            result, clean_article_content(text)
+        )
+
+
+def test_format_with_metadata_header():
+    result = SimpleNamespace(
+        source_provider="jina",
+        fallback_url=None,
+        metadata=SimpleNamespace(
+            title="Hello", source_url=None, url="https://x.test", published_time=""
+        ),
+    )
+    assert format_with_metadata(result, "body") == (
+        "Source Provider: jina\n"
+        "Title: Hello\n"
+        "URL Source: https://x.test\n"
+        "\nMarkdown Content:\nbody"
+    )
+
+
+def test_format_with_metadata_passthrough_without_metadata():
+    assert format_with_metadata(object(), "body") == "body"
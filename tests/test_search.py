@@ -0,0 +1,168 @@
+"""Unit tests for Serper pagination in fcrawl.commands.search.
+
+No network access — a fake session stands in for Serper.
+
+Run with: uv run pytest tests/test_search.py -v
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+
+import orjson
+from click.testing import CliRunner
+
+from fcrawl.commands import search as search_mod
+from fcrawl.utils import cache
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.content = orjson.dumps(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class _FakeSession:
+    """Serves `total` distinct links, `num` per page, like Serper's paging."""
+
+    def __init__(self, total, repeat_page=None):
+        self.total = total
+        self.repeat_page = repeat_page
+        self.calls = []
+        self.lock = threading.Lock()
+        self.headers = {}
+
+    def post(self, url, json=None, timeout=None, stream=False):
+        with self.lock:
+            self.calls.append((json["page"], json["num"]))
+        page, num = json["page"], json["num"]
+        if page == self.repeat_page:
+            page -= 1
+        first = (page - 1) * num
+        organic = [
+            {"link": f"https://r.test/{i}", "title": str(i)}
+            for i in range(first, min(first + num, self.total))
+        ]
+        return _FakeResponse({"organic": organic})
+
+
+def _run(monkeypatch, session, limit, prefetch=True):
+    monkeypatch.setattr(search_mod, "_get_session", lambda: session)
+    return search_mod._serper_search(
+        "q", limit, "us", "en", None, "key", prefetch=prefetch
+    )
+
+
+def test_serper_search_merges_pages_in_order(monkeypatch):
+    session = _FakeSession(total=1000)
+    results, _, error, pages, *_ = _run(monkeypatch, session, 250)
+    assert error is None
+    assert [r["url"] for r in results] == [f"https://r.test/{i}" for i in range(250)]
+    assert [r["position"] for r in results] == list(range(1, 251))
+    assert pages == 3
+    assert sorted(session.calls) == [(1, 100), (2, 100), (3, 100)]
+
+
+def test_serper_search_stops_on_page_without_new_links(monkeypatch):
+    session = _FakeSession(total=1000, repeat_page=2)
+    results, _, error, pages, *_ = _run(monkeypatch, session, 200)
+    assert error is None
+    # Page 2 repeated page 1, so nothing new came back and paging stops
+    assert len(results) == 100
+    assert pages == 2
+
+
+def test_serper_search_stops_when_results_run_out(monkeypatch):
+    session = _FakeSession(total=130)
+    results, _, error, pages, *_ = _run(monkeypatch, session, 300)
+    assert error is None
+    assert len(results) == 130
+    assert pages == 3
+
+
+def test_serper_search_without_prefetch_probes_page_one_first(monkeypatch):
+    session = _FakeSession(total=60)
+    results, _, error, pages, *_ = _run(monkeypatch, session, 250, prefetch=False)
+    assert error is None
+    assert len(results) == 60
+    # Page 1 is fetched alone before any other page is requested
+    assert session.calls[0] == (1, 100)
+    assert (2, 100) in session.calls
+    assert pages == len(session.calls)
+
+
+def test_cached_search_round_trips_and_ignores_unknown_keys():
+    cached = search_mod.CachedSearch(results=[{"url": "u"}], elapsed=0.5, pages=1)
+    data = dataclasses.asdict(cached)
+    assert search_mod.CachedSearch.from_dict({**data, "future": 1}) == cached
+    assert search_mod.CachedSearch.from_dict({}).results == []
+
+
+def test_still_fresh_compares_top_urls(monkeypatch):
+    monkeypatch.setattr(search_mod, "_get_session", lambda: _FakeSession(total=50))
+    top = [{"url": f"https://r.test/{i}"} for i in range(30)]
+    cached = search_mod.CachedSearch(results=top)
+    assert search_mod._still_fresh("q", cached, 30, None, "key")
+
+    moved = search_mod.CachedSearch(results=top[1:])
+    assert not search_mod._still_fresh("q", moved, 30, None, "key")
+    # Small searches are refetched rather than probed
+    assert not search_mod._still_fresh("q", cached, 10, None, "key")
+
+
+def test_serper_search_rejects_oversized_response(monkeypatch):
+    monkeypatch.setattr(search_mod, "SERPER_MAX_RESPONSE_BYTES", 1000)
+    results, _, error, *_ = _run(monkeypatch, _FakeSession(total=100), 100)
+    assert (results, error) == ([], "API error: oversized response")
+
+
+def test_bulk_search_emits_one_json_line_per_query(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(search_mod, "_get_session", lambda: _FakeSession(total=5))
+    monkeypatch.setattr(search_mod, "_get_serper_api_key", lambda: "key")
+
+    result = CliRunner().invoke(
+        search_mod.search, ["-", "-l", "2"], input="first\n\nsecond\n"
+    )
+    assert result.exit_code == 0, result.output
+    records = [orjson.loads(line) for line in result.output.splitlines()]
+    assert [r["query"] for r in records] == ["first", "second"]
+    assert [len(r["results"]) for r in records] == [2, 2]
+    assert not any(r["meta"]["from_cache"] for r in records)
+
+    result = CliRunner().invoke(
+        search_mod.search, ["-", "-l", "2", "--cache-only"], input="second\nthird\n"
+    )
+    records = [orjson.loads(line) for line in result.output.splitlines()]
+    assert records[0]["meta"]["from_cache"] is True
+    assert records[1] == {"query": "third", "error": "Not in cache"}
+
+
+def test_bulk_search_writes_utf8_and_rejects_display_flags(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(search_mod, "_get_session", lambda: _FakeSession(total=5))
+    monkeypatch.setattr(search_mod, "_get_serper_api_key", lambda: "key")
+
+    out = tmp_path / "results.jsonl"
+    result = CliRunner().invoke(
+        search_mod.search, ["-", "-l", "1", "-o", str(out)], input="café\n"
+    )
+    assert result.exit_code == 0, result.output
+    assert orjson.loads(out.read_bytes())["query"] == "café"
+
+    for flag in ("--pretty", "--urls-only", "--debug"):
+        result = CliRunner().invoke(search_mod.search, ["-", flag], input="q\n")
+        assert result.exit_code == 2
+        assert flag in result.output
@@ -0,0 +1,35 @@
+"""Unit tests for subtitle formatting in fcrawl.commands.transcribe.
+
+Run with: uv run pytest tests/test_transcribe_format.py -v
+"""
+
+from __future__ import annotations
+
+from fcrawl.commands.transcribe import format_as_srt, format_as_vtt
+
+TEXT = "你好世界。This is a longer English sentence, spoken slowly! Ok?"
+
+
+def test_format_as_srt_cues():
+    # 10s per sentence on average, scaled by length and clamped to [1s, 10s]
+    assert format_as_srt(TEXT, 30.0) == (
+        "1\n00:00:00,000 --> 00:00:02,500\n你好世界。\n\n"
+        "2\n00:00:02,500 --> 00:00:12,500\n"
+        "This is a longer English sentence, spoken slowly!\n\n"
+        "3\n00:00:12,500 --> 00:00:14,000\nOk?\n"
+    )
+
+
+def test_format_as_vtt_cues():
+    assert format_as_vtt(TEXT, 30.0) == (
+        "WEBVTT\n\n"
+        "1\n00:00:00.000 --> 00:00:02.500\n你好世界。\n\n"
+        "2\n00:00:02.500 --> 00:00:12.500\n"
+        "This is a longer English sentence, spoken slowly!\n\n"
+        "3\n00:00:12.500 --> 00:00:14.000\nOk?\n"
+    )
+
+
+def test_empty_transcript():
+    assert format_as_srt("  ", 10.0) == ""
+    assert format_as_vtt("", 10.0) == "WEBVTT\n\n"
@@ -7,6 +7,7 @@ import pytest
 
 from fcrawl.commands._x_diagnose import check_xclid
 from fcrawl.vendors.twscrape.accounts_pool import AccountsPool, NoAccountError
+from fcrawl.vendors.twscrape.imap import _wait_email_code
 from fcrawl.vendors.twscrape.queue_client import classify_error, response_body_snippet
 from fcrawl.vendors.twscrape.utils import utc
 
@@ -95,6 +96,50 @@ def test_no_account_error_distinguishes_inactive_auth_failures(tmp_path):
     run(scenario())
 
 
+def test_login_all_runs_logins_concurrently(tmp_path):
+    async def scenario():
+        pool = AccountsPool(db_file=str(tmp_path / "accounts.db"))
+        for i in range(5):
+            await pool.add_account(f"user{i}", "pw", f"user{i}@example.com", "pw")
+
+        running = peak = 0
+
+        async def fake_login(account):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return account.username != "user3"
+
+        pool.login = fake_login
+        result = await pool.login_all(concurrency=2)
+        assert result == {"total": 5, "success": 4, "failed": 1}
+        assert peak == 2
+
+    run(scenario())
+
+
+def test_wait_email_code_only_reads_codes_sent_to_the_account():
+    def mail(to, code):
+        return (
+            f"From: info@x.com\r\nTo: {to}\r\n"
+            f"Date: Mon, 05 Oct 2026 10:00:00 +0000\r\n"
+            f"Subject: Your X confirmation code is {code}\r\n\r\n"
+        ).encode()
+
+    class Inbox:
+        # Newest message last, as IMAP numbers them
+        messages = [mail("alice@example.com", "AAA111"), mail("Bob <bob@example.com>", "BBB222")]
+
+        def fetch(self, num, _parts):
+            return "OK", [(b"", self.messages[int(num) - 1])]
+
+    assert _wait_email_code(Inbox(), 2, None, "alice@example.com") == "aaa111"
+    assert _wait_email_code(Inbox(), 2, None, "BOB@example.com") == "bbb222"
+    assert _wait_email_code(Inbox(), 2, None, "carol@example.com") is None
+
+
 def test_response_body_snippet_compacts_and_limits_body():
     rep = httpx.Response(
         403,
@@ -0,0 +1,239 @@
+"""Unit tests for the prefetch and JSON helpers in fcrawl.commands.x.
+
+No network access — the twscrape generators are replaced by local ones and
+tweets come from the twitterapi.io fixtures.
+
+Run with: uv run pytest tests/test_x_helpers.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import aclosing
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from fcrawl.commands.x import (
+    _collect,
+    _fetch_batch,
+    _iter_json,
+    _prefetch,
+    _print_json_or_save,
+    _stream_json,
+    _x_default,
+    display_article,
+    display_tweets,
+    display_user,
+    extract_article_tweet_id,
+    extract_tweet_id,
+    format_number,
+    tweet_to_dict,
+)
+from fcrawl.utils.output import dump_json
+from fcrawl.utils.x_client import run_x
+from fcrawl.vendors.twscrape import account
+from fcrawl.vendors.twscrape.accounts_pool import AccountsPool
+from fcrawl.vendors.twscrape.queue_client import QueueClient
+from fcrawl.vendors.twitterapi_io import to_tweet
+
+FIXTURES = Path(__file__).parent / "fixtures" / "twitterapi_io"
+
+
+def test_prefetch_preserves_order_and_closes_source_on_break():
+    closed = []
+
+    async def source():
+        try:
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield i
+        finally:
+            closed.append(True)
+
+    async def run():
+        seen = []
+        async with aclosing(_prefetch(source())) as gen:
+            async for item in gen:
+                seen.append(item)
+                if len(seen) == 4:
+                    break
+        return seen
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    assert closed == [True]
+
+
+def test_collect_stops_at_limit():
+    async def source():
+        for i in range(100):
+            yield i
+
+    assert asyncio.run(_collect(source(), 5)) == [0, 1, 2, 3, 4]
+    assert asyncio.run(_collect(source(), 500)) == list(range(100))
+
+
+def test_prefetch_reraises_source_errors():
+    async def source():
+        yield 1
+        raise RuntimeError("boom")
+
+    async def run():
+        return [item async for item in _prefetch(source())]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run())
+
+
+def test_iter_json_matches_single_encode():
+    tweet = {"id": 1, "user": {"username": "a"}, "hashtags": ["x", "y"]}
+    for data in (
+        [],
+        {},
+        [tweet, tweet],
+        {"thread": [tweet], "replies": [], "article": {"title": "T"}},
+        tweet,
+        "scalar",
+    ):
+        assert b"".join(_iter_json(data)) == dump_json(data)
+
+
+def _fixture_tweet():
+    with open(FIXTURES / "tweet_with_quote.json") as f:
+        return to_tweet(json.load(f))
+
+
+def test_iter_json_serializes_tweet_objects():
+    tweet = _fixture_tweet()
+    expected = dump_json({"thread": [tweet_to_dict(tweet)], "replies": []})
+    assert b"".join(_iter_json({"thread": [tweet], "replies": []})) == expected
+
+
+def test_stream_json_writes_same_bytes_as_single_encode(tmp_path):
+    tweet = _fixture_tweet()
+
+    async def source(n):
+        for _ in range(n):
+            yield tweet
+
+    path = tmp_path / "out" / "tweets.json"
+    assert asyncio.run(_stream_json(source(5), 3, str(path))) == 3
+    assert path.read_bytes() == dump_json([tweet_to_dict(tweet)] * 3)
+    assert not (path.parent / "tweets.json.part").exists()
+
+    empty = tmp_path / "empty.json"
+    assert asyncio.run(_stream_json(source(0), 3, str(empty))) == 0
+    assert not empty.exists()
+
+
+def test_stream_json_leaves_no_partial_file_on_error(tmp_path):
+    tweet = _fixture_tweet()
+
+    async def failing():
+        yield tweet
+        raise RuntimeError("rate limited")
+
+    path = tmp_path / "tweets.json"
+    with pytest.raises(RuntimeError, match="rate limited"):
+        asyncio.run(_stream_json(failing(), 10, str(path)))
+    assert list(tmp_path.iterdir()) == []
+
+    path.write_bytes(b"[]")
+    with pytest.raises(RuntimeError, match="rate limited"):
+        asyncio.run(_stream_json(failing(), 10, str(path)))
+    assert path.read_bytes() == b"[]"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_print_json_or_save_streams_tweets_when_piped(capsys):
+    tweet = _fixture_tweet()
+    _print_json_or_save([tweet, tweet], None, True)
+    out = capsys.readouterr().out
+    assert out == dump_json([tweet_to_dict(tweet)] * 2).decode() + "\n"
+
+
+def test_run_x_shares_and_closes_the_loop_transport():
+    async def main():
+        first = account.shared_transport()
+        assert account.shared_transport() is first
+
+    run_x(main())
+    assert len(account._SHARED_TRANSPORTS) == 0
+
+
+def test_extract_tweet_ids():
+    assert extract_tweet_id("1234567890") == 1234567890
+    assert extract_tweet_id(" 42 ") == 42
+    assert extract_tweet_id("https://x.com/a/status/123?s=20") == 123
+    assert extract_article_tweet_id("https://x.com/i/article/77") == 77
+    assert extract_article_tweet_id("https://twitter.com/a/status/88/photo/1") == 88
+    with pytest.raises(ValueError):
+        extract_tweet_id("https://x.com/a")
+
+
+def test_tty_and_orjson_paths_render_dates_alike():
+    tweet = _fixture_tweet()
+    via_orjson = json.loads(dump_json(tweet, default=_x_default))
+    via_stdlib = json.loads(json.dumps(tweet, default=_x_default))
+    assert via_orjson == via_stdlib
+    assert via_orjson["date"] == tweet.date.isoformat()
+
+
+def test_format_number_rounds_to_one_decimal():
+    assert format_number(None) == "0"
+    assert format_number(999) == "999"
+    assert format_number(1_260) == "1.3K"
+    assert format_number(1_999) == "2.0K"
+    assert format_number(1_260_000) == "1.3M"
+
+
+class _LockingAPI:
+    """Stands in for twscrape's API: each call holds a queue lock like a request."""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def user_by_login(self, handle):
+        async with QueueClient(self.pool, "UserByScreenName"):
+            await asyncio.sleep(0.01)
+        return SimpleNamespace(id=handle)
+
+    async def user_tweets(self, uid, limit=-1):
+        async with QueueClient(self.pool, "UserTweets"):
+            await asyncio.sleep(0.01)
+            yield f"{uid}-tweet"
+
+
+def test_fetch_batch_runs_in_turn_on_a_one_account_pool(tmp_path):
+    async def main():
+        pool = AccountsPool(db_file=str(tmp_path / "accounts.db"), raise_when_no_account=True)
+        await pool.add_account_from_tokens("one", "ct0", "auth")
+        return await _fetch_batch(_LockingAPI(pool), ["a", "b", "c", "d"], 5, 4)
+
+    results = run_x(main())
+    assert [(u.id, tweets) for u, tweets in results] == [
+        (h, [f"{h}-tweet"]) for h in "abcd"
+    ]
+
+
+def test_display_article_prints_brackets_literally(capsys):
+    article = SimpleNamespace(
+        title="Notes [draft]",
+        to_markdown=lambda: "[bold]unclosed and [docs here](https://a.b)",
+        cover_image_url="https://c.d/img.png",
+    )
+    display_article(article)
+    out = capsys.readouterr().out
+    assert "Article: Notes [draft]" in out
+    assert "[bold]unclosed and [docs here](https://a.b)" in out
+
+
+def test_display_names_with_brackets_print_literally(capsys):
+    tweet = _fixture_tweet()
+    tweet.user.displayname = "Ann [/x] [he/him]"
+    display_tweets([tweet, tweet])
+    display_user(tweet.user)
+    out = capsys.readouterr().out
+    assert out.count("(Ann [/x] [he/him])") == 3